@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import ctypes
+from collections.abc import Callable
 from colorsys import rgb_to_hls, rgb_to_hsv
 from enum import Enum, auto
 from functools import partial
@@ -101,17 +102,25 @@ class ColorPickerPlugin(WidgetPluginBase[GlobalSettings], IconReloadMixin):
     COL_VALUES_START = 1
 
     RGB30_FORMATS: tuple[QImage.Format, ...] = Packer.FORMAT_CONFIG[10][2:]
-    RGBA_FORMATS: tuple[QImage.Format, ...] = tuple(zip(*Packer.FORMAT_CONFIG.values()))[3]
+    # Alpha-capable QImage formats of every packer bit depth (Format_ARGB32, Format_A2RGB30_Premultiplied)
+    RGBA_FORMATS: frozenset[QImage.Format] = frozenset(config[3] for config in Packer.FORMAT_CONFIG.values())
 
     def __init__(self, parent: QWidget, api: PluginAPI) -> None:
         super().__init__(parent, api)
         IconReloadMixin.__init__(self)
 
-        self.tracking = TrackingState.INACTIVE
+        self._tracking = TrackingState.INACTIVE
+        self._tracking_active = False
         self.outputs = dict[VideoOutputProxy, CachedVideoNode]()
 
         self.current_num_planes = 0
         self.current_rgb_cols = 3  # Track RGB columns (3 for RGB, 4 for RGBA)
+        self.current_is_rgb30 = False
+
+        # Format callables for rendered values, rebuilt only when the image format or the decimals setting changes
+        self.rgb_hex_fmt: Callable[[int], str] = "{:02X}".format
+        self.current_decimals_nb = self.settings.global_.decimals_nb
+        self.rgb_norm_fmt: Callable[[float], str] = f"{{:.{self.current_decimals_nb}f}}".format
 
         # Format strings for source values
         self.src_hex_fmt = ""
@@ -217,6 +226,16 @@ class ColorPickerPlugin(WidgetPluginBase[GlobalSettings], IconReloadMixin):
         else:
             self.groups_layout.setDirection(QBoxLayout.Direction.TopToBottom)
 
+    @property
+    def tracking(self) -> TrackingState:
+        return self._tracking
+
+    @tracking.setter
+    def tracking(self, value: TrackingState) -> None:
+        self._tracking = value
+        # Plain bool mirror checked first by the per-event mouse hooks
+        self._tracking_active = value is TrackingState.ACTIVE
+
     # Plugin hooks
     def on_current_voutput_changed(self, voutput: VideoOutputProxy, tab_index: int) -> None:
         if voutput not in self.outputs:
@@ -238,22 +257,27 @@ class ColorPickerPlugin(WidgetPluginBase[GlobalSettings], IconReloadMixin):
             self.update_labels(self.api.current_view.viewport.map_from_global(QCursor.pos()))
 
     def on_view_context_menu(self, event: QContextMenuEvent) -> None:
-        if self.tracking == TrackingState.DEACTIVATING or self.eyedropper_btn.isChecked():
+        if self._tracking is TrackingState.INACTIVE:
+            return
+
+        if self._tracking is TrackingState.DEACTIVATING or self.eyedropper_btn.isChecked():
             self.eyedropper_btn.setChecked(False)
             event.ignore()
 
     def on_view_mouse_moved(self, event: QMouseEvent) -> None:
-        if self.tracking == TrackingState.ACTIVE and not self.api.is_playing:
-            self.update_labels(event.position().toPoint())
+        if not self._tracking_active or self.api.is_playing:
+            return
+
+        self.update_labels(event.position().toPoint())
 
     def on_view_mouse_pressed(self, event: QMouseEvent) -> None:
-        if self.tracking == TrackingState.ACTIVE and event.button() == Qt.MouseButton.RightButton:
+        if self._tracking_active and event.button() == Qt.MouseButton.RightButton:
             self.tracking = TrackingState.DEACTIVATING
             self.api.current_view.viewport.set_cursor(Qt.CursorShape.OpenHandCursor)
             event.accept()
 
     def on_view_mouse_released(self, event: QMouseEvent) -> None:
-        if self.tracking == TrackingState.ACTIVE and event.button() == Qt.MouseButton.LeftButton:
+        if self._tracking_active and event.button() == Qt.MouseButton.LeftButton:
             self.api.current_view.viewport.set_cursor(Qt.CursorShape.CrossCursor)
 
     # Plugin methods
@@ -273,6 +297,8 @@ class ColorPickerPlugin(WidgetPluginBase[GlobalSettings], IconReloadMixin):
         labels_dict.clear()
         copy_btns_dict.clear()
 
+        value_font = get_monospace_font(10)
+
         for row_idx, name in enumerate(row_names):
             # Row label
             lbl = QLabel(f"{name}:", self)
@@ -290,7 +316,7 @@ class ColorPickerPlugin(WidgetPluginBase[GlobalSettings], IconReloadMixin):
                     textInteractionFlags=Qt.TextInteractionFlag.TextSelectableByMouse,
                     alignment=Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
                 )
-                val_lbl.setFont(get_monospace_font(10))
+                val_lbl.setFont(value_font)
                 val_lbl.setMinimumWidth(65)
                 val_lbl.setCursor(Qt.CursorShape.IBeamCursor)
                 val_labels.append(val_lbl)
@@ -383,6 +409,14 @@ class ColorPickerPlugin(WidgetPluginBase[GlobalSettings], IconReloadMixin):
         has_alpha = img_format in self.RGBA_FORMATS
         max_val = 1023 if is_rgb30 else 255
 
+        if is_rgb30 != self.current_is_rgb30:
+            self.current_is_rgb30 = is_rgb30
+            self.rgb_hex_fmt = ("{:03X}" if is_rgb30 else "{:02X}").format
+
+        if (decimals_nb := self.settings.global_.decimals_nb) != self.current_decimals_nb:
+            self.current_decimals_nb = decimals_nb
+            self.rgb_norm_fmt = f"{{:.{decimals_nb}f}}".format
+
         # Rebuild grid if alpha state changed
         required_cols = 4 if has_alpha else 3
         if required_cols != self.current_rgb_cols:
@@ -403,18 +437,16 @@ class ColorPickerPlugin(WidgetPluginBase[GlobalSettings], IconReloadMixin):
 
         self.position_label.cursor_pos = pos
 
-        rgb_norm = f"{{:.{self.settings.global_.decimals_nb}f}}"
-        hex_fmt = f"{{:0{3 if is_rgb30 else 2}X}}"
+        hex_fmt = self.rgb_hex_fmt
+        norm_fmt = self.rgb_norm_fmt
 
         # Build value lists based on alpha presence
-        hex_vals = [hex_fmt.format(r), hex_fmt.format(g), hex_fmt.format(b)]
-        dec_vals = [f"{r}", f"{g}", f"{b}"]
-        norm_vals = [rgb_norm.format(r_f), rgb_norm.format(g_f), rgb_norm.format(b_f)]
+        channels = (r, g, b, a) if has_alpha else (r, g, b)
+        channels_f = (r_f, g_f, b_f, a_f) if has_alpha else (r_f, g_f, b_f)
 
-        if has_alpha:
-            hex_vals.append(hex_fmt.format(a))
-            dec_vals.append(f"{a}")
-            norm_vals.append(rgb_norm.format(a_f))
+        hex_vals = [hex_fmt(v) for v in channels]
+        dec_vals = [str(v) for v in channels]
+        norm_vals = [norm_fmt(v) for v in channels_f]
 
         self._set_row_values(self.rgb_labels, "Hex", hex_vals)
         self._set_row_values(self.rgb_labels, "Dec", dec_vals)
@@ -14,7 +14,7 @@ FIELD_CATEGORY = CategoryMatcher(
 )
 
 
-FIELD_FORMATTERS = [
+FIELD_FORMATTERS: tuple[FormatterProperty, ...] = (
     FormatterProperty(
         prop_key="_Combed",
         value_formatter={0: "No", 1: "Yes"},
@@ -23,4 +23,4 @@ FIELD_FORMATTERS = [
         prop_key="_Field",
         value_formatter={0: "Bottom Field", 1: "Top Field"},
     ),
-]
+)
@@ -22,7 +22,7 @@ METRICS_CATEGORY = CategoryMatcher(
 )
 
 
-METRICS_FORMATTERS = [
+METRICS_FORMATTERS: tuple[FormatterProperty, ...] = (
     # Scene change detection
     FormatterProperty(
         prop_key="_SceneChangeNext",
@@ -32,4 +32,4 @@ METRICS_FORMATTERS = [
         prop_key="_SceneChangePrev",
         value_formatter={0: "Current Scene", 1: "Start of Scene"},
     ),
-]
+)
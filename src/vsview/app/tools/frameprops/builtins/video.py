@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Hashable
 from enum import Enum
 
 from vapoursynth import (
@@ -38,35 +39,50 @@ VIDEO_CATEGORY = CategoryMatcher(
 )
 
 
-def _format_enum(value: int, enum: type[Enum]) -> str:
-    return enum(value).name.split("_", 1)[1:][0]
+def _build_enum_map(enum: type[Enum], title: bool = False) -> dict[Hashable, str]:
+    # Strip the member prefix once at import, e.g. MATRIX_BT709 -> BT709
+    enum_map = dict[Hashable, str]()
 
+    for member in enum:
+        name = member.name.split("_", 1)[-1]
+        enum_map[member.value] = name.title() if title else name
 
-VIDEO_FORMATTERS: list[FormatterProperty] = [
+    return enum_map
+
+
+_CHROMA_LOC_MAP = _build_enum_map(ChromaLocation, title=True)
+_COLOR_RANGE_MAP = _build_enum_map(ColorRange, title=True)
+_MATRIX_MAP = _build_enum_map(MatrixCoefficients)
+_TRANSFER_MAP = _build_enum_map(TransferCharacteristics)
+_PRIMARIES_MAP = _build_enum_map(ColorPrimaries)
+_FIELD_MAP = _build_enum_map(FieldBased, title=True)
+
+
+VIDEO_FORMATTERS: tuple[FormatterProperty, ...] = (
     # Enum-based formatters
     FormatterProperty(
         prop_key="_ChromaLocation",
-        value_formatter=lambda v: _format_enum(v, ChromaLocation).title(),
+        value_formatter=_CHROMA_LOC_MAP,
     ),
     FormatterProperty(
         prop_key="_ColorRange",
-        value_formatter=lambda v: _format_enum(v, ColorRange).title(),
+        value_formatter=_COLOR_RANGE_MAP,
     ),
     FormatterProperty(
         prop_key="_Matrix",
-        value_formatter=lambda v: _format_enum(v, MatrixCoefficients),
+        value_formatter=_MATRIX_MAP,
     ),
     FormatterProperty(
         prop_key="_Transfer",
-        value_formatter=lambda v: _format_enum(v, TransferCharacteristics),
+        value_formatter=_TRANSFER_MAP,
     ),
     FormatterProperty(
         prop_key="_Primaries",
-        value_formatter=lambda v: _format_enum(v, ColorPrimaries),
+        value_formatter=_PRIMARIES_MAP,
     ),
     FormatterProperty(
         prop_key="_FieldBased",
-        value_formatter=lambda v: _format_enum(v, FieldBased).title(),
+        value_formatter=_FIELD_MAP,
     ),
     # Others
     FormatterProperty(prop_key="_PictType"),
@@ -74,4 +90,4 @@ VIDEO_FORMATTERS: list[FormatterProperty] = [
     FormatterProperty(prop_key="_DurationDen"),
     FormatterProperty(prop_key="_SARNum"),
     FormatterProperty(prop_key="_SARDen"),
-]
+)
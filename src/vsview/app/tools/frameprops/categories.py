@@ -4,7 +4,8 @@ Category matching system for frame properties.
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass, field
 
 from jetpytools import Singleton, flatten, inject_self
@@ -35,14 +36,20 @@ class CategoryMatcher:
     def matches(self, prop_key: str) -> bool:
         """Check if a property key matches this category."""
 
-        if prop_key in self.exact_matches:
-            return True
+        return _matches(prop_key, self.exact_matches, tuple(self.prefixes), tuple(self.suffixes))
 
-        for prefix in self.prefixes:
-            if prop_key.startswith(prefix):
-                return True
 
-        return any(prop_key.endswith(suffix) for suffix in self.suffixes)
+type _MatchRules = tuple[frozenset[str], tuple[str, ...], tuple[str, ...]]
+
+
+def _matches(
+    prop_key: str, exact_matches: AbstractSet[str], prefixes: tuple[str, ...], suffixes: tuple[str, ...]
+) -> bool:
+    if prop_key in exact_matches:
+        return True
+
+    # str.startswith/endswith accept a tuple and test every affix in a single call
+    return prop_key.startswith(prefixes) or prop_key.endswith(suffixes)
 
 
 type IterCategoryMatcher = Iterable[CategoryMatcher | IterCategoryMatcher]
@@ -52,7 +59,11 @@ class CategoryRegistry(Singleton):
     """Registry for property categories with extensible matching."""
 
     def __init__(self) -> None:
-        self._matchers = list[CategoryMatcher]()
+        self._matchers = tuple[CategoryMatcher, ...]()
+        self._rules = tuple[tuple[str, _MatchRules], ...]()  # (name, rules) of each matcher, in matching order
+        self._category_orders = dict[str, int]()
+        self._category_cache = dict[str, str]()  # Resolved category per property key
+        self._sorted_categories: tuple[str, ...] = (self.default_category,)
 
     @inject_self.property
     def default_category(self) -> str:
@@ -60,24 +71,63 @@ class CategoryRegistry(Singleton):
 
     @inject_self
     def register(self, *matcher: CategoryMatcher | IterCategoryMatcher) -> None:
-        self._matchers.extend(flatten(matcher))
-        # Keep matchers sorted by priority (highest first)
-        self._matchers.sort(key=lambda m: m.priority, reverse=True)
+        # Keep matchers sorted by priority (highest first) in an immutable snapshot iterated by get_category
+        self._matchers = tuple(sorted((*self._matchers, *flatten(matcher)), key=lambda m: m.priority, reverse=True))
+        # Read-only snapshots of the matching rules, retaken for every matcher so edits made before any
+        # registration are picked up
+        self._rules = tuple(
+            (m.name, (frozenset(m.exact_matches), tuple(m.prefixes), tuple(m.suffixes))) for m in self._matchers
+        )
+        # Index display orders by category name, the highest priority matcher wins for duplicate names
+        self._category_orders = {m.name: m.order for m in reversed(self._matchers)}
+        # Every name get_category can return, in display order
+        self._sorted_categories = tuple(
+            sorted(dict.fromkeys((*self._category_orders, self.default_category)), key=self.get_category_order)
+        )
+        # New matchers may change the category of already resolved keys
+        self._category_cache.clear()
 
     @inject_self
     def get_category(self, prop_key: str) -> str:
-        for matcher in self._matchers:
-            if matcher.matches(prop_key):
-                return matcher.name
+        if (category := self._category_cache.get(prop_key)) is not None:
+            return category
+
+        return self._resolve_category(prop_key)
+
+    @inject_self.property
+    def category_key(self) -> Callable[[str], str]:
+        """Equivalent of `get_category` for bulk lookups, skipping the `inject_self` dispatch on every call."""
+
+        def key(
+            prop_key: str,
+            _get: Callable[[str], str | None] = self._category_cache.get,
+            _resolve: Callable[[str], str] = self._resolve_category,
+        ) -> str:
+            return _get(prop_key) or _resolve(prop_key)
+
+        return key
+
+    def _resolve_category(self, prop_key: str) -> str:
+        for name, rules in self._rules:
+            if _matches(prop_key, *rules):
+                category = name
+                break
+        else:
+            category = self.default_category
+
+        self._category_cache[prop_key] = category
+
+        return category
+
+    @inject_self.property
+    def sorted_categories(self) -> tuple[str, ...]:
+        """All category names sorted by display order (lowest first)."""
 
-        return self.default_category
+        return self._sorted_categories
 
     @inject_self
     def get_category_order(self, category_name: str) -> int:
-        for matcher in self._matchers:
-            if matcher.name == category_name:
-                return matcher.order
-        return 999  # Unknown categories go last
+        return self._category_orders.get(category_name, 999)  # Unknown categories go last
 
 
 CategoryRegistry()
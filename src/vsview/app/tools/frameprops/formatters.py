@@ -4,15 +4,15 @@ Property formatter system for frame properties.
 
 from __future__ import annotations
 
-from collections.abc import Callable, Hashable, Iterable
-from dataclasses import dataclass
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from dataclasses import dataclass, field
 from logging import getLogger
 from typing import Any
 
-from jetpytools import Singleton, flatten, inject_self
+from jetpytools import Singleton
 from vapoursynth import VideoFrame
 
-__all__ = ["FormatterProperty", "FormatterRegistry"]
+__all__ = ["FORMATTER_REGISTRY", "FormatterProperty", "FormatterRegistry"]
 
 logger = getLogger(__name__)
 
@@ -30,69 +30,151 @@ class FormatterProperty:
     - Callable: Transform the value to a string
     - dict: Map values to strings (for enums/lookups)
     - None: Use default str() conversion
+
+    Formatting runs in a background worker thread, so a callable must be thread-safe and must not touch Qt objects.
     """
 
+    _format_fn: Callable[[Any], str] = field(init=False, repr=False, compare=False)
+    _error_logged: bool = field(default=False, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Pick the formatting path once instead of re-checking the formatter kind on every value.
+        # Most registered properties have no formatter, followed by enum lookup tables.
+        if (vf := self.value_formatter) is None:
+            self._format_fn = self.default_format
+        elif isinstance(vf, dict):
+            self._format_fn = self._compile_mapping(vf)
+        else:
+            self._format_fn = self._format_callable
+
     def format_value(self, value: Any) -> str:
-        if callable(self.value_formatter):
-            try:
-                return self.value_formatter(value)
-            except Exception:
+        return self._format_fn(value)
+
+    def _format_callable(self, value: Any) -> str:
+        try:
+            return self.value_formatter(value)  # type: ignore[operator,misc]
+        except Exception:
+            # A broken formatter fails on every frame, only capture the traceback the first time
+            if self._error_logged:
+                logger.debug("Falling back to the default format for %r with value %r", self.prop_key, value)
+            else:
                 logger.exception("There was an error when trying to format %r:", self.prop_key)
-                return self.default_format(value)
+                self._error_logged = True
+
+            return self.default_format(value)
+
+    @staticmethod
+    def _compile_mapping(mapping: dict[Hashable, str]) -> Callable[[Any], str]:
+        # Specialized dictionary lookup (for enums) with the lookups bound once at construction
+        get = mapping.get
+        default_format = FormatterProperty.default_format
 
-        # Dictionary lookup (for enums)
-        if isinstance(self.value_formatter, dict):
-            return self.value_formatter.get(value, self.default_format(value))
+        def format_mapping(value: Any) -> str:
+            # The fallback string is only built on a miss
+            if (formatted := get(value)) is not None:
+                return formatted
 
-        return self.default_format(value)
+            return default_format(value)
+
+        return format_mapping
 
     @staticmethod
     def default_format(value: Any, repr_frame: bool = False) -> str:
-        match value:
-            case bytes():
-                return value.decode("utf-8")
-            case float():
-                return f"{value:.6g}"
-            case VideoFrame():
-                return repr(value) if repr_frame else str(value).replace("\t", "    ").rstrip()
-            case _:
-                return str(value)
+        if repr_frame and isinstance(value, VideoFrame):
+            return repr(value)
+
+        if (formatter := _DEFAULT_FORMATTERS.get(type(value))) is None:
+            formatter = _resolve_default_formatter(type(value))
+
+        return formatter(value)
+
+
+# Type lookup for FormatterProperty.default_format, subclasses are resolved once and added on first use
+_DEFAULT_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    bytes: lambda v: v.decode("utf-8"),
+    float: lambda v: f"{v:.6g}",
+    VideoFrame: lambda v: str(v).replace("\t", "    ").rstrip(),
+}
+
+
+def _resolve_default_formatter(tp: type) -> Callable[[Any], str]:
+    # The closest registered base wins, anything else falls back to str()
+    formatter = next((_DEFAULT_FORMATTERS[base] for base in tp.__mro__ if base in _DEFAULT_FORMATTERS), str)
+    _DEFAULT_FORMATTERS[tp] = formatter
+
+    return formatter
 
 
 type IterFormatter = Iterable[FormatterProperty | IterFormatter]
 
 
+def _iter_formatters(items: IterFormatter) -> Iterator[FormatterProperty]:
+    # Stack-based walk over the nested hook results, only FormatterProperty instances are leaves
+    stack = [iter(items)]
+
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, FormatterProperty):
+                yield item
+            else:
+                stack.append(iter(item))
+                break
+        else:
+            stack.pop()
+
+
 class FormatterRegistry(Singleton):
-    """Registry for property formatters."""
+    """Registry for property formatters. Use the `FORMATTER_REGISTRY` instance."""
+
+    __slots__ = ("_format_table", "_formatters", "_next_order", "_order")
 
     def __init__(self) -> None:
         self._formatters = dict[str, FormatterProperty]()
         self._order = dict[str, int]()  # Track registration order
         self._next_order = 0
+        # Bound format functions of the properties with a configured formatter, built on register
+        self._format_table = dict[str, Callable[[Any], str]]()
 
-    @inject_self
     def has_formatter(self, key: str) -> bool:
         """Check if a key has a configurable formatter."""
 
         return key in self._formatters and self._formatters[key].value_formatter is not None
 
-    @inject_self
     def register(self, *formatter: FormatterProperty | IterFormatter) -> None:
-        """Register a property formatter."""
+        """
+        Register a property formatter.
 
-        for f in flatten(formatter):
+        The formatters are called from a background worker thread, see `FormatterProperty.value_formatter`.
+        """
+
+        for f in _iter_formatters(formatter):
             self._formatters[f.prop_key] = f
 
+            if f.value_formatter is None:
+                self._format_table.pop(f.prop_key, None)
+            else:
+                self._format_table[f.prop_key] = f._format_fn
+
             if f.prop_key not in self._order:
                 self._order[f.prop_key] = self._next_order
                 self._next_order -= 1
 
-    @inject_self
     def get_property_order(self, prop_key: str) -> int:
         """Get the display order for a property. Returns low value for unregistered properties."""
         return self._order.get(prop_key, -1000)
 
-    @inject_self
+    def sort_keys(self, keys: list[str]) -> list[str]:
+        """
+        Return the keys in display order, same as sorting by `get_property_order` with reverse=True.
+
+        Registered keys are sorted with the C-level `dict.__getitem__` as the key.
+        Unregistered keys all share the lowest order, so they keep their relative order at the end.
+        """
+        order = self._order
+        ordered = sorted((k for k in keys if k in order), key=order.__getitem__, reverse=True)
+        ordered.extend(k for k in keys if k not in order)
+        return ordered
+
     def format_value(self, key: str, value: Any) -> str:
         """Format a property value for display."""
         if key in self._formatters:
@@ -100,5 +182,12 @@ class FormatterRegistry(Singleton):
 
         return FormatterProperty.default_format(value)
 
+    def format_property(self, key: str, value: Any) -> str | None:
+        """Format a property value with its configured formatter. Returns None if the key has none."""
+        if (format_fn := self._format_table.get(key)) is None:
+            return None
+
+        return format_fn(value)
+
 
-FormatterRegistry()
+FORMATTER_REGISTRY = FormatterRegistry()
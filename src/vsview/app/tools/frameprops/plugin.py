@@ -2,18 +2,41 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import defaultdict
-from collections.abc import Mapping
+from collections.abc import Hashable, Iterable, Mapping
 from contextlib import suppress
 from logging import getLogger
-from typing import Annotated, Any, ClassVar, NamedTuple
+from typing import Annotated, Any, ClassVar, NamedTuple, overload
 
 import pluggy
 import vapoursynth as vs
 from jetpytools import fallback
 from pydantic import BaseModel
-from PySide6.QtCore import QModelIndex, QPersistentModelIndex, QPoint, QSignalBlocker, QSize, Qt, Signal
-from PySide6.QtGui import QAction, QImage, QPixmap, QStandardItem, QStandardItemModel
+from PySide6.QtCore import (
+    QAbstractItemModel,
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    QPoint,
+    QPointF,
+    QSignalBlocker,
+    QSize,
+    Qt,
+    QTimer,
+    Signal,
+)
+from PySide6.QtGui import (
+    QFontMetrics,
+    QImage,
+    QPainter,
+    QPalette,
+    QPixmap,
+    QStaticText,
+    QTextOption,
+    QTransform,
+)
 from PySide6.QtWidgets import (
     QApplication,
     QComboBox,
@@ -44,16 +67,18 @@ from vsview.api import (
     LocalSettingsModel,
     PluginAPI,
     WidgetPluginBase,
+    run_in_background,
     run_in_loop,
 )
 from vsview.app.plugins.api import VideoOutputProxy
+from vsview.app.utils import LRUCache
 
 from . import specs
 from .builtins.field import FIELD_CATEGORY, FIELD_FORMATTERS
 from .builtins.metrics import METRICS_CATEGORY, METRICS_FORMATTERS
 from .builtins.video import VIDEO_CATEGORY, VIDEO_FORMATTERS
 from .categories import CategoryRegistry
-from .formatters import FormatterProperty, FormatterRegistry
+from .formatters import FORMATTER_REGISTRY, FormatterProperty
 
 # Item roles and types
 ROLE_ITEM_TYPE = Qt.ItemDataRole.UserRole + 1
@@ -63,6 +88,9 @@ ROLE_FORMATTED_VALUE = Qt.ItemDataRole.UserRole + 3
 ITEM_TYPE_CATEGORY = "category"
 ITEM_TYPE_PROPERTY = "property"
 
+# Read-only, selectable items
+ITEM_FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
 logger = getLogger(__name__)
 
 manager = pluggy.PluginManager("vsview.frameprops")
@@ -75,10 +103,41 @@ class RowData(NamedTuple):
     raw_value: Any
 
 
+class PreparedRow(NamedTuple):
+    """A property row with its display strings already computed."""
+
+    key: str
+    value: Any
+    value_str: str
+    formatted: str = ""
+
+
+# Prepared rows are cached per props mapping. Each entry keeps its mapping, and with it the frame, alive.
+PREPARED_CACHE_SIZE = 8
+
+
 class FramePropsViewMixin:
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
 
+    def _setup_context_menu(self: FramePropsTreeView | FramePropsTableView) -> None:  # type: ignore[misc]
+        # Built once and retargeted at the clicked row every time it is shown
+        self._context_data: RowData | None = None
+        self.context_menu = QMenu(self)
+
+        self.preview_action = self.context_menu.addAction("Preview Frame")
+        self.preview_action.triggered.connect(self._on_preview_action)
+        self.preview_separator = self.context_menu.addSeparator()
+
+        self.copy_key_action = self.context_menu.addAction("Copy Key")
+        self.copy_key_action.triggered.connect(self._on_copy_key_action)
+
+        self.copy_row_action = self.context_menu.addAction("Copy as Key=Value")
+        self.copy_row_action.triggered.connect(self._on_copy_row_action)
+
+        self.copy_value_action = self.context_menu.addAction("Copy Value")
+        self.copy_value_action.triggered.connect(self._on_copy_value_action)
+
     def get_row_data(self: FramePropsTreeView | FramePropsTableView, index: QModelIndex) -> RowData:  # type: ignore[misc]
         model = self.model()
         row = index.row()
@@ -97,32 +156,34 @@ class FramePropsViewMixin:
             return
 
         # TreeView specific: ignore categories
-        if (item := self.current_model.itemFromIndex(index)) and item.data(ROLE_ITEM_TYPE) == ITEM_TYPE_CATEGORY:
+        if index.data(ROLE_ITEM_TYPE) == ITEM_TYPE_CATEGORY:
             return
 
-        data = self.get_row_data(index)
+        self._context_data = data = self.get_row_data(index)
 
-        menu = QMenu(self)
+        is_frame = isinstance(data.raw_value, vs.VideoFrame)
+        self.preview_action.setVisible(is_frame)
+        self.preview_separator.setVisible(is_frame)
 
-        if isinstance(data.raw_value, vs.VideoFrame):
-            preview_action = QAction("Preview Frame", self)
-            preview_action.triggered.connect(lambda: self.previewRequested.emit(data.raw_value, data.raw_key))
-            menu.addAction(preview_action)
-            menu.addSeparator()
+        self.context_menu.exec(self.viewport().mapToGlobal(pos))
+        # Don't keep a previewable frame alive until the next right click
+        self._context_data = None
 
-        copy_key_action = QAction("Copy Key", self)
-        copy_key_action.triggered.connect(lambda: self._copy_to_clipboard(data.raw_key, "key"))
-        menu.addAction(copy_key_action)
+    def _on_preview_action(self: FramePropsTreeView | FramePropsTableView) -> None:  # type: ignore[misc]
+        if (data := self._context_data) is not None:
+            self.previewRequested.emit(data.raw_value, data.raw_key)
 
-        copy_row_action = QAction("Copy as Key=Value", self)
-        copy_row_action.triggered.connect(lambda: self._copy_to_clipboard(f"{data.raw_key}={data.raw_value}", "row"))
-        menu.addAction(copy_row_action)
+    def _on_copy_key_action(self: FramePropsTreeView | FramePropsTableView) -> None:  # type: ignore[misc]
+        if (data := self._context_data) is not None:
+            self._copy_to_clipboard(data.raw_key, "key")
 
-        copy_value_action = QAction("Copy Value", self)
-        copy_value_action.triggered.connect(lambda: self._copy_to_clipboard(data.raw_value, "value"))
-        menu.addAction(copy_value_action)
+    def _on_copy_row_action(self: FramePropsTreeView | FramePropsTableView) -> None:  # type: ignore[misc]
+        if (data := self._context_data) is not None:
+            self._copy_to_clipboard(f"{data.raw_key}={data.raw_value}", "row")
 
-        menu.exec(self.viewport().mapToGlobal(pos))
+    def _on_copy_value_action(self: FramePropsTreeView | FramePropsTableView) -> None:  # type: ignore[misc]
+        if (data := self._context_data) is not None:
+            self._copy_to_clipboard(data.raw_value, "value")
 
     def _copy_to_clipboard(self: FramePropsTreeView | FramePropsTableView, text: str, description: str) -> None:  # type: ignore[misc]
         QApplication.clipboard().setText(text)
@@ -132,53 +193,152 @@ class FramePropsViewMixin:
 
 
 class WordWrapDelegate(QStyledItemDelegate):
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        # Wrapped value sizes keyed by (text, column width, font key).
+        # The width is part of the key so resizing the column never returns stale heights.
+        self._size_cache = LRUCache[tuple[str, int, str], QSize](4096)
+        # Text margin of the last seen style and font metrics per font key, reused across size hints
+        self._margin_style: QStyle | None = None
+        self._text_margin = 0
+        self._font_metrics = dict[str, QFontMetrics]()
+        # Laid out value texts keyed by (text, text width, font key), painted without reshaping
+        self._static_text_cache = LRUCache[tuple[str, int, str], QStaticText](1024)
+
     def initStyleOption(self, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex) -> None:
         super().initStyleOption(option, index)
         if index.column() == 1:
             option.features |= QStyleOptionViewItem.ViewItemFeature.WrapText
             option.textElideMode = Qt.TextElideMode.ElideNone
 
-    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex) -> QSize:
-        size = super().sizeHint(option, index)
+    def paint(
+        self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex
+    ) -> None:
+        if index.column() != 1:
+            return super().paint(painter, option, index)
+
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+
+        if not (text := opt.text):
+            return super().paint(painter, option, index)
+
+        widget = opt.widget
+        style = widget.style() if widget else QApplication.style()
 
+        text_margin = style.pixelMetric(QStyle.PixelMetric.PM_FocusFrameHMargin, opt, widget) + 1
+        text_rect = style.subElementRect(QStyle.SubElement.SE_ItemViewItemText, opt, widget)
+        text_rect.adjust(text_margin, 0, -text_margin, 0)
+
+        # The style still draws the background, selection and focus
+        opt.text = ""
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, opt, painter, widget)
+
+        cache_key = (text, text_rect.width(), opt.font.key())
+
+        if cache_key in self._static_text_cache:
+            static_text = self._static_text_cache[cache_key]
+        else:
+            static_text = QStaticText(text)
+            static_text.setTextFormat(Qt.TextFormat.PlainText)
+            text_option = QTextOption(Qt.AlignmentFlag.AlignLeft)
+            text_option.setWrapMode(QTextOption.WrapMode.WrapAtWordBoundaryOrAnywhere)
+            static_text.setTextOption(text_option)
+            static_text.setTextWidth(text_rect.width())
+            static_text.prepare(QTransform(), opt.font)
+            self._static_text_cache[cache_key] = static_text
+
+        if not opt.state & QStyle.StateFlag.State_Enabled:
+            color_group = QPalette.ColorGroup.Disabled
+        elif not opt.state & QStyle.StateFlag.State_Active:
+            color_group = QPalette.ColorGroup.Inactive
+        else:
+            color_group = QPalette.ColorGroup.Normal
+
+        if opt.state & QStyle.StateFlag.State_Selected:
+            color_role = QPalette.ColorRole.HighlightedText
+        else:
+            color_role = QPalette.ColorRole.Text
+
+        # Vertically centered like the default item text
+        y = text_rect.top() + max(0.0, (text_rect.height() - static_text.size().height()) / 2)
+
+        painter.save()
+        painter.setClipRect(text_rect)
+        painter.setFont(opt.font)
+        painter.setPen(opt.palette.color(color_group, color_role))
+        painter.drawStaticText(QPointF(text_rect.left(), y), static_text)
+        painter.restore()
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex) -> QSize:
         if index.column() != 1:
-            return size
+            return super().sizeHint(option, index)
 
         if not (text := index.data(Qt.ItemDataRole.DisplayRole)):
-            return size
+            return super().sizeHint(option, index)
 
         if isinstance((view := option.widget), QTreeView):
             header = view.header()
         elif isinstance(view, QTableView):
             header = view.horizontalHeader()
         else:
-            return size
+            return super().sizeHint(option, index)
 
         if (column_width := header.sectionSize(index.column())) <= 0:
-            return size
+            return super().sizeHint(option, index)
+
+        text = str(text)
+        font_key = option.font.key()
+        cache_key = (text, column_width, font_key)
 
-        text_margin = view.style().pixelMetric(QStyle.PixelMetric.PM_FocusFrameHMargin, option, view) + 1
-        available_width = column_width - (2 * text_margin) - 4
+        if cache_key in self._size_cache:
+            return self._size_cache[cache_key]
 
-        text_rect = option.fontMetrics.boundingRect(
+        size = super().sizeHint(option, index)
+
+        if (style := view.style()) is not self._margin_style:
+            self._margin_style = style
+            self._text_margin = style.pixelMetric(QStyle.PixelMetric.PM_FocusFrameHMargin, option, view) + 1
+
+        if (font_metrics := self._font_metrics.get(font_key)) is None:
+            font_metrics = self._font_metrics[font_key] = QFontMetrics(option.font)
+
+        available_width = column_width - (2 * self._text_margin) - 4
+
+        text_rect = font_metrics.boundingRect(
             0,
             0,
             available_width,
             10000,
             Qt.TextFlag.TextWordWrap | Qt.AlignmentFlag.AlignLeft,
-            str(text),
+            text,
         )
 
-        return QSize(size.width(), max(size.height(), text_rect.height() + 4))
+        size = QSize(size.width(), max(size.height(), text_rect.height() + 4))
+        self._size_cache[cache_key] = size
 
+        return size
+
+
+class FramePropsModel(QAbstractItemModel):
+    """
+    Two-level model: category rows at the top level, their property rows as children.
+
+    Category indexes carry an internal id of 0, property indexes the row of their category + 1.
+    """
 
-class FramePropsModel(QStandardItemModel):
     FORMATTED_COLUMN: ClassVar[int] = 2
+    HEADERS: ClassVar[tuple[str, ...]] = ("Key", "Value", "Formatted")
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
-        self.setHorizontalHeaderLabels(["Key", "Value", "Formatted"])
-        self.category_items = dict[str, QStandardItem]()
+        # Displayed rows grouped by category, shared with the prepared rows cache
+        self.categories = list[tuple[str, list[PreparedRow]]]()
+        self._last_props: Mapping[str, Any] | None = None
+        # Categorized and formatted rows per props mapping (keyed by id, the entry holds the mapping itself)
+        self._prepared_cache = LRUCache[int, tuple[Mapping[str, Any], list[tuple[str, list[PreparedRow]]]]](
+            PREPARED_CACHE_SIZE
+        )
 
         CategoryRegistry.register(
             VIDEO_CATEGORY,
@@ -186,79 +346,154 @@ class FramePropsModel(QStandardItemModel):
             FIELD_CATEGORY,
             manager.hook.vsview_frameprops_register_category_matchers(),
         )
-        FormatterRegistry.register(
+        FORMATTER_REGISTRY.register(
             VIDEO_FORMATTERS,
             METRICS_FORMATTERS,
             FIELD_FORMATTERS,
             manager.hook.vsview_frameprops_register_formatter_properties(),
         )
 
-    def add_prop(self, key: str, value: Any, category: str | None = None) -> None:
-        raw_value_str = FormatterProperty.default_format(value)
-        formatted_value = FormatterRegistry.format_value(key, value) if FormatterRegistry.has_formatter(key) else ""
+    def index(self, row: int, column: int, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
 
-        # Row: raw key + raw value + formatted value
-        key_item = self._create_item(key, ITEM_TYPE_PROPERTY, key)
-        value_item = self._create_item(raw_value_str, ITEM_TYPE_PROPERTY, value)
-        formatted_item = self._create_item(formatted_value, ITEM_TYPE_PROPERTY, None)
+        if not parent.isValid():
+            return self.createIndex(row, column, id=0)
 
-        self._add_to_category(key_item, value_item, formatted_item, key, category)
+        return self.createIndex(row, column, id=parent.row() + 1)
 
-    def _add_to_category(
-        self,
-        key_item: QStandardItem,
-        value_item: QStandardItem,
-        formatted_item: QStandardItem,
-        ref_key: str,
-        category: str | None = None,
-    ) -> None:
-        if category is None:
-            category = CategoryRegistry.get_category(ref_key)
+    @overload
+    def parent(self) -> QObject | None: ...
+    @overload
+    def parent(self, child: QModelIndex | QPersistentModelIndex) -> QModelIndex: ...
+    def parent(self, child: QModelIndex | QPersistentModelIndex | None = None) -> QObject | QModelIndex | None:
+        if child is None:
+            return super().parent()
+
+        if not child.isValid() or not (category_id := child.internalId()):
+            return QModelIndex()
+
+        return self.createIndex(category_id - 1, 0, id=0)
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        if not parent.isValid():
+            return len(self.categories)
+
+        if parent.internalId() or parent.column():
+            return 0
+
+        return len(self.categories[parent.row()][1])
+
+    def columnCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return len(self.HEADERS)
 
-        if category not in self.category_items:
-            category_item = self._create_item(category, ITEM_TYPE_CATEGORY)
-            empty_value = self._create_item("", ITEM_TYPE_CATEGORY)
-            empty_formatted = self._create_item("", ITEM_TYPE_CATEGORY)
-            self.appendRow([category_item, empty_value, empty_formatted])
-            self.category_items[category] = category_item
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
 
-        parent = self.category_items[category]
-        parent.appendRow([key_item, value_item, formatted_item])
+        column = index.column()
+
+        if not (category_id := index.internalId()):
+            match role:
+                case Qt.ItemDataRole.DisplayRole:
+                    return self.categories[index.row()][0] if column == 0 else ""
+                case _ if role == ROLE_ITEM_TYPE:
+                    return ITEM_TYPE_CATEGORY
+
+            return None
+
+        row = self.categories[category_id - 1][1][index.row()]
+
+        match role:
+            case Qt.ItemDataRole.DisplayRole:
+                return row.key if column == 0 else row.value_str if column == 1 else row.formatted
+            case _ if role == ROLE_RAW_DATA:
+                return row.key if column == 0 else row.value if column == 1 else None
+            case _ if role == ROLE_ITEM_TYPE:
+                return ITEM_TYPE_PROPERTY
+
+        return None
+
+    def flags(self, index: QModelIndex | QPersistentModelIndex) -> Qt.ItemFlag:
+        return ITEM_FLAGS if index.isValid() else Qt.ItemFlag.NoItemFlags
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+
+        return None
+
+    @staticmethod
+    def _prepare_row(key: str, value: Any) -> PreparedRow:
+        return PreparedRow(
+            key,
+            value,
+            FormatterProperty.default_format(value),
+            FORMATTER_REGISTRY.format_property(key, value) or "",
+        )
+
+    def is_loaded(self, props: Mapping[str, Any]) -> bool:
+        # Revisiting the frame that is already displayed hands back the very same props mapping
+        return props is self._last_props
 
     def load_props(self, props: Mapping[str, Any]) -> None:
-        self.clear_props()
+        if self.is_loaded(props):
+            return
+
+        # Nothing to categorize, only reset if there are rows to drop
+        if not props:
+            if self.categories:
+                self.clear_props()
+            return
+
+        if (props_id := id(props)) in self._prepared_cache:
+            prepared = self._prepared_cache[props_id][1]
+        else:
+            prepared = self.prepare_rows(props)
+            self.add_prepared(props, prepared)
+
+        # Rows are prepared while the previous ones are still shown, the swap is a single reset
+        self.beginResetModel()
+        self.categories = prepared
+        self._last_props = props
+        self.endResetModel()
+
+    @staticmethod
+    def prepare_rows(props: Mapping[str, Any]) -> list[tuple[str, list[PreparedRow]]]:
+        """Categorize, order and format the props. Touches no Qt object and is safe to run in a worker thread."""
 
         # Group properties by category
+        category_key = CategoryRegistry.category_key
         categories = defaultdict[str, list[str]](list)
         for key in props:
-            categories[CategoryRegistry.get_category(key)].append(key)
-
-        # Sort categories by order (lowest first)
-        sorted_categories = sorted(categories, key=lambda c: CategoryRegistry.get_category_order(c))
+            categories[category_key(key)].append(key)
 
-        for category in sorted_categories:
-            items = list[tuple[int, str]]()
+        sort_keys = FORMATTER_REGISTRY.sort_keys
+        prepared = list[tuple[str, list[PreparedRow]]]()
 
-            for key in categories.get(category, []):
-                order = FormatterRegistry.get_property_order(key)
-                items.append((order, key))
+        # Categories are walked in their precomputed display order
+        for category in CategoryRegistry.sorted_categories:
+            if not (keys := categories.get(category)):
+                continue
 
-            items.sort(key=lambda x: x[0], reverse=True)
+            prepared.append((category, [FramePropsModel._prepare_row(key, props[key]) for key in sort_keys(keys)]))
 
-            for _, item in items:
-                self.add_prop(item, props[item], category)
+        return prepared
 
     def clear_props(self) -> None:
-        self.removeRows(0, self.rowCount())
-        self.category_items.clear()
+        self.beginResetModel()
+        self.categories = []
+        self._last_props = None
+        self.endResetModel()
+
+    def has_prepared(self, props: Mapping[str, Any]) -> bool:
+        return id(props) in self._prepared_cache
 
-    def _create_item(self, text: str, item_type: str, raw_data: Any | None = None) -> QStandardItem:
-        item = QStandardItem(text)
-        item.setEditable(False)
-        item.setData(item_type, ROLE_ITEM_TYPE)
-        if raw_data is not None:
-            item.setData(raw_data, ROLE_RAW_DATA)
-        return item
+    def add_prepared(self, props: Mapping[str, Any], prepared: list[tuple[str, list[PreparedRow]]]) -> None:
+        self._prepared_cache[id(props)] = (props, prepared)
+
+    def clear_prepared(self) -> None:
+        self._prepared_cache.clear()
 
 
 class FramePropsTreeView(QTreeView, FramePropsViewMixin):
@@ -278,7 +513,14 @@ class FramePropsTreeView(QTreeView, FramePropsViewMixin):
         self.setAnimated(True)
         self.setIndentation(self.indentation() // 2)
 
-        self.setItemDelegate(WordWrapDelegate(self))
+        # Key column is only fitted to its contents when the set of keys changes
+        self._fitted_keys = frozenset[str]()
+
+        # Coalesces the relayouts requested by a column drag into a single pass once the events settle
+        self._relayout_timer = QTimer(self)
+        self._relayout_timer.setSingleShot(True)
+        self._relayout_timer.setInterval(0)
+        self._relayout_timer.timeout.connect(self.doItemsLayout)
 
         header = self.header()
         header.setDefaultAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -295,12 +537,31 @@ class FramePropsTreeView(QTreeView, FramePropsViewMixin):
 
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self._show_context_menu)
+        self._setup_context_menu()
 
     @run_in_loop(return_future=False)
     def update_props(self, props: Mapping[str, Any]) -> None:
-        self.current_model.load_props(props)
-        self.expandAll()
-        self.resizeColumnToContents(0)
+        if self.current_model.is_loaded(props):
+            return
+
+        # Suppress intermediate repaints and expand animations while the tree is rebuilt, expanded and resized
+        was_animated = self.isAnimated()
+        self.setAnimated(False)
+        self.setUpdatesEnabled(False)
+
+        try:
+            self.current_model.load_props(props)
+            self.expandAll()
+
+            if (keys := frozenset(props)) != self._fitted_keys:
+                self._fitted_keys = keys
+                self.resizeColumnToContents(0)
+                # Fitting the key column resizes the stretched value column too. The layout scheduled by
+                # the model reset already runs with the final widths, so the coalesced relayout is redundant.
+                self._relayout_timer.stop()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.setAnimated(was_animated)
 
     def set_show_formatted(self, show: bool) -> None:
         if show:
@@ -312,36 +573,99 @@ class FramePropsTreeView(QTreeView, FramePropsViewMixin):
 
     def _on_section_resized(self, logical_index: int, old_size: int, new_size: int) -> None:
         if logical_index == 1 and old_size != new_size:
-            self.doItemsLayout()
+            self._relayout_timer.start()
+
 
+class FramePropsTableModel(QAbstractTableModel):
+    HEADERS: ClassVar[tuple[str, ...]] = ("Key", "Value")
 
-class FramePropsTableModel(QStandardItemModel):
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
-        self.setHorizontalHeaderLabels(["Key", "Value"])
+        # Displayed rows, shared with the prepared rows cache
+        self.rows = list[PreparedRow]()
+        self._last_props: Mapping[str, Any] | None = None
+        # Sorted and formatted rows per props mapping (keyed by id, the entry holds the mapping itself)
+        self._prepared_cache = LRUCache[int, tuple[Mapping[str, Any], list[PreparedRow]]](PREPARED_CACHE_SIZE)
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        row = self.rows[index.row()]
+
+        match role:
+            case Qt.ItemDataRole.DisplayRole:
+                return row.key if index.column() == 0 else row.value_str
+            case _ if role == ROLE_RAW_DATA:
+                return row.key if index.column() == 0 else row.value
+
+        return None
+
+    def flags(self, index: QModelIndex | QPersistentModelIndex) -> Qt.ItemFlag:
+        return ITEM_FLAGS if index.isValid() else Qt.ItemFlag.NoItemFlags
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+
+        return None
+
+    def is_loaded(self, props: Mapping[str, Any]) -> bool:
+        return props is self._last_props
 
     def load_props(self, props: Mapping[str, Any]) -> None:
-        self.clear_rows()
+        if self.is_loaded(props):
+            return
 
-        sorted_keys = sorted(props.keys(), key=lambda x: (not x.startswith("_"), x))
+        if not props:
+            if self.rows:
+                self.clear_rows()
+            return
 
-        for key in sorted_keys:
-            value = props[key]
-            formatted_value = FormatterProperty.default_format(value, repr_frame=True)
+        if (props_id := id(props)) in self._prepared_cache:
+            prepared = self._prepared_cache[props_id][1]
+        else:
+            prepared = self.prepare_rows(props)
+            self.add_prepared(props, prepared)
 
-            key_item = self._create_item(key, key)
-            value_item = self._create_item(formatted_value, value)
+        self.beginResetModel()
+        self.rows = prepared
+        self._last_props = props
+        self.endResetModel()
 
-            self.appendRow([key_item, value_item])
+    @staticmethod
+    def prepare_rows(props: Mapping[str, Any]) -> list[PreparedRow]:
+        """Sort and format the props. Touches no Qt object and is safe to run in a worker thread."""
+
+        # Underscore-prefixed (reserved) props first, each group sorted by name
+        sorted_keys = sorted(k for k in props if k.startswith("_"))
+        sorted_keys.extend(sorted(k for k in props if not k.startswith("_")))
+
+        return [
+            PreparedRow(key, props[key], FormatterProperty.default_format(props[key], repr_frame=True))
+            for key in sorted_keys
+        ]
 
     def clear_rows(self) -> None:
-        self.removeRows(0, self.rowCount())
+        self.beginResetModel()
+        self.rows = []
+        self._last_props = None
+        self.endResetModel()
+
+    def has_prepared(self, props: Mapping[str, Any]) -> bool:
+        return id(props) in self._prepared_cache
+
+    def add_prepared(self, props: Mapping[str, Any], prepared: list[PreparedRow]) -> None:
+        self._prepared_cache[id(props)] = (props, prepared)
 
-    def _create_item(self, text: str, raw_data: Any) -> QStandardItem:
-        item = QStandardItem(text)
-        item.setEditable(False)
-        item.setData(raw_data, ROLE_RAW_DATA)
-        return item
+    def clear_prepared(self) -> None:
+        self._prepared_cache.clear()
 
 
 class FramePropsTableView(QTableView, FramePropsViewMixin):
@@ -357,11 +681,13 @@ class FramePropsTableView(QTableView, FramePropsViewMixin):
 
         self.setAlternatingRowColors(True)
         self.setShowGrid(False)
-        self.setItemDelegate(WordWrapDelegate(self))
+
+        # Key column is only fitted to its contents when the set of keys changes
+        self._fitted_keys = frozenset[str]()
 
         self.horizontalHeader().setDefaultAlignment(Qt.AlignmentFlag.AlignCenter)
         self.horizontalHeader().setStretchLastSection(True)
-        self.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        self.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
         self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
         self.verticalHeader().setVisible(False)
 
@@ -371,29 +697,59 @@ class FramePropsTableView(QTableView, FramePropsViewMixin):
 
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self._show_context_menu)
+        self._setup_context_menu()
 
     @run_in_loop(return_future=False)
     def update_props(self, props: Mapping[str, Any]) -> None:
+        if self.current_model.is_loaded(props):
+            return
+
         self.current_model.load_props(props)
 
+        if (keys := frozenset(props)) != self._fitted_keys:
+            self._fitted_keys = keys
+            self.resizeColumnToContents(0)
+
 
 class FramePropPreviewGraphicsView(BaseGraphicsView):
     def __init__(self, parent: QWidget | None, api: PluginAPI) -> None:
         super().__init__(parent)
         self.api = api
-        self._f2c_cache = dict[int, vs.VideoNode]()
+        # Blank clips keyed by (width, height, format id), bounded so previewed formats don't pin nodes forever
+        self._f2c_cache = LRUCache[tuple[int, int, int], vs.VideoNode](16)
+        # Converted previews keyed by (output index, frame number, prop key), the pixmaps own their pixels.
+        # The displayed pixmap is always the most recently used entry, so it is never evicted while shown.
+        self._pixmap_cache = LRUCache[Hashable, QPixmap](8)
         self.api.register_on_destroy(self._f2c_cache.clear)
+        self.api.register_on_destroy(self._pixmap_cache.clear)
+
+    def set_frame(self, frame: vs.VideoFrame, key: Hashable | None = None) -> None:
+        """Show the frame, reusing the pixmap cached under `key` if any. The caller keeps ownership of the frame."""
+
+        if key is not None and key in self._pixmap_cache:
+            pixmap = self._pixmap_cache[key]
+        else:
+            qimage, owner = self.frame_to_qimage(frame)
+
+            # Detach the pixels, the pixmap would otherwise borrow the memory of the frame closed right after
+            with owner:
+                pixmap = QPixmap.fromImage(qimage.copy())
 
-    def set_frame(self, frame: vs.VideoFrame) -> None:
-        with frame:
-            qimage = self.frame_to_qimage(frame)
+            if key is not None:
+                self._pixmap_cache[key] = pixmap
 
-        self.pixmap_item.setPixmap(QPixmap.fromImage(qimage))
+        self.pixmap_item.setPixmap(pixmap)
 
         if self.autofit:
             self.set_zoom(0)
 
-    def frame_to_qimage(self, frame: vs.VideoFrame) -> QImage:
+    def frame_to_qimage(self, frame: vs.VideoFrame) -> tuple[QImage, vs.VideoFrame]:
+        """
+        Wrap the frame's pixels in a QImage without copying them.
+
+        Returns the image and the frame owning its memory, which must outlive the image and any pixmap made from it.
+        """
+
         match frame.format.id:
             case vs.GRAY8:
                 fmt = QImage.Format.Format_Grayscale8
@@ -403,27 +759,33 @@ class FramePropPreviewGraphicsView(BaseGraphicsView):
                 with self.api.vs_context():
                     packed_clip = self.api.packer.pack_clip(self.frame2clip(frame))
 
-                    with packed_clip.get_frame(0) as packed:
-                        return self.api.packer.frame_to_qimage(packed).copy()
+                    packed = packed_clip.get_frame(0)
+
+                    return self.api.packer.frame_to_qimage(packed), packed
 
-        return QImage(
+        qimage = QImage(
             get_plane_buffer(frame, 0),  # type: ignore[call-overload]
             frame.width,
             frame.height,
             frame.get_stride(0),
             fmt,
-        ).copy()
+        )
+
+        # The copy shares the source memory, closing it leaves the caller's frame open
+        return qimage, frame.copy()
 
     def frame2clip(self, frame: vs.VideoFrame) -> vs.VideoNode:
-        key = hash((frame.width, frame.height, frame.format.id))
+        key = (frame.width, frame.height, frame.format.id)
 
-        if key not in self._f2c_cache:
-            self._f2c_cache[key] = vs.core.std.BlankClip(
+        if key in self._f2c_cache:
+            blank = self._f2c_cache[key]
+        else:
+            blank = self._f2c_cache[key] = vs.core.std.BlankClip(
                 width=frame.width, height=frame.height, format=frame.format, keep=True
             )
 
         frame_cp = frame.copy()
-        return vs.core.std.ModifyFrame(self._f2c_cache[key], self._f2c_cache[key], lambda n, f: frame_cp)
+        return vs.core.std.ModifyFrame(blank, blank, lambda n, f: frame_cp)
 
 
 class GlobalSettings(BaseModel):
@@ -503,6 +865,17 @@ class FramePropsPlugin(WidgetPluginBase[GlobalSettings, LocalSettings], IconRelo
         self.history_combo.setMinimumWidth(150)
         self.history_combo.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
         self.history_combo.currentIndexChanged.connect(self._on_history_selected)
+        # Sorted frame numbers mirroring the combo items and the frame currently labelled "(Current)"
+        self._history_frames = list[int]()
+        self._history_current: int | None = None
+
+        # Frame changes are coalesced so scrubbing and playback only refresh the latest frame
+        self._pending_frame: int | None = None
+        self._flushed_frame: int | None = None
+        self._coalesce_timer = QTimer(self)
+        self._coalesce_timer.setSingleShot(True)
+        self._coalesce_timer.setInterval(40)
+        self._coalesce_timer.timeout.connect(self._flush_pending)
 
         self.next_btn = self.make_tool_button(
             IconName.ARROW_RIGHT,
@@ -525,6 +898,12 @@ class FramePropsPlugin(WidgetPluginBase[GlobalSettings, LocalSettings], IconRelo
 
         self.raw_table = FramePropsTableView(self.stack)
         self.categorize_tree = FramePropsTreeView(self.stack)
+
+        # Both views wrap the same values, so they share one delegate and its layout caches
+        self.value_delegate = WordWrapDelegate(self)
+        self.raw_table.setItemDelegate(self.value_delegate)
+        self.categorize_tree.setItemDelegate(self.value_delegate)
+
         self.raw_table.copyMessage.connect(self.status_message)
         self.categorize_tree.copyMessage.connect(self.status_message)
 
@@ -578,17 +957,46 @@ class FramePropsPlugin(WidgetPluginBase[GlobalSettings, LocalSettings], IconRelo
         self.splitter.addWidget(self.preview_container)
 
         self.splitter.setSizes([1, 0])
+        self.splitter.splitterMoved.connect(self._on_splitter_moved)
+
+        # Whether a preview is shown, refresh_preview runs on every frame change and checks this first
+        self._preview_visible = False
+        # Latest props handed to update_views, rows prepared in the background are only applied for these
+        self._requested_props: Mapping[str, Any] | None = None
+        # Frame numbers of the requested props and of the props the views show, keying the preview pixmaps
+        self._requested_frame: int | None = None
+        self._shown_frame: int | None = None
 
         layout.addWidget(self.splitter)
 
         self.api.register_on_destroy(close_btn.click)
+        self.api.register_on_destroy(self.categorize_tree.current_model.clear_prepared)
+        self.api.register_on_destroy(self.raw_table.current_model.clear_prepared)
 
     def on_current_voutput_changed(self, voutput: VideoOutputProxy, tab_index: int) -> None:
         self._hide_preview()
+        # Don't keep the previous output's frames alive through the prepared rows
+        self._requested_props = None
+        self._requested_frame = self._shown_frame = None
+        self._flushed_frame = None
+        self.categorize_tree.current_model.clear_prepared()
+        self.raw_table.current_model.clear_prepared()
         return super().on_current_voutput_changed(voutput, tab_index)
 
     def on_current_frame_changed(self, n: int) -> None:
-        self.update_history_ui(n)
+        self._pending_frame = n
+        self._schedule_flush()
+
+    @run_in_loop(return_future=False)
+    def _schedule_flush(self) -> None:
+        if not self._coalesce_timer.isActive():
+            self._coalesce_timer.start()
+
+    def _flush_pending(self) -> None:
+        if (frame := self._pending_frame) is None or frame == self._flushed_frame:
+            return
+
+        self.update_history_ui(frame)
 
     def on_playback_started(self) -> None:
         self.history_combo.setEnabled(False)
@@ -604,33 +1012,101 @@ class FramePropsPlugin(WidgetPluginBase[GlobalSettings, LocalSettings], IconRelo
         if current_frame not in (props_cache := self.api.current_voutput.props):
             return
 
-        available_frames = list(props_cache.keys())
         props = props_cache[current_frame]
+        self._flushed_frame = current_frame
 
+        # The views are updated right below, _on_history_selected would only repeat that work
         with QSignalBlocker(self.history_combo):
-            self.history_combo.clear()
+            self._sync_history_items(props_cache.keys(), current_frame)
+            self.history_combo.setCurrentIndex(bisect_left(self._history_frames, current_frame))
 
-            for frame in sorted(available_frames):
-                label = f"Frame {frame} (Current)" if frame == current_frame else f"Frame {frame}"
-                self.history_combo.addItem(label, frame)
+        self.update_views(props, current_frame)
+        self.update_nav_buttons()
+        self.refresh_preview(props, current_frame)
 
-        current_index = -1
-        for i in range(self.history_combo.count()):
-            if self.history_combo.itemData(i) == current_frame:
-                current_index = i
-                break
+    def _sync_history_items(self, available_frames: Iterable[int], current_frame: int) -> None:
+        # Only the frames that entered or left the props cache are inserted or removed,
+        # and only the old and new current entries are relabelled
+        frames = self._history_frames
+        available = set(available_frames)
 
-        if current_index >= 0:
-            self.history_combo.setCurrentIndex(current_index)
+        if available.isdisjoint(frames):
+            # Nothing carries over (first fill or another output), rebuild the items in one batch
+            self.history_combo.clear()
+            frames[:] = sorted(available)
+            self.history_combo.addItems([f"Frame {frame}" for frame in frames])
 
-        self.update_views(props)
-        self.update_nav_buttons()
-        self.refresh_preview(current_frame)
+            for index, frame in enumerate(frames):
+                self.history_combo.setItemData(index, frame)
+        else:
+            for frame in set(frames) - available:
+                index = bisect_left(frames, frame)
+                self.history_combo.removeItem(index)
+                del frames[index]
+
+            for frame in sorted(available.difference(frames)):
+                index = bisect_left(frames, frame)
+                self.history_combo.insertItem(index, f"Frame {frame}", frame)
+                frames.insert(index, frame)
+
+        if (previous := self._history_current) is not None and previous != current_frame and previous in available:
+            self.history_combo.setItemText(bisect_left(frames, previous), f"Frame {previous}")
+
+        self.history_combo.setItemText(bisect_left(frames, current_frame), f"Frame {current_frame} (Current)")
+        self._history_current = current_frame
+
+    def update_views(self, props: Mapping[str, Any], frame: int) -> None:
+        self._requested_props = props
+        self._requested_frame = frame
+
+        if not props or (
+            self.categorize_tree.current_model.has_prepared(props) and self.raw_table.current_model.has_prepared(props)
+        ):
+            self._apply_views(props)
+        else:
+            # Formatting runs off the GUI thread, the views keep showing the previous frame meanwhile
+            self._prepare_views(props)
 
-    def update_views(self, props: Mapping[str, Any]) -> None:
+    def _apply_views(self, props: Mapping[str, Any]) -> None:
+        # Only ever called with the requested props
+        self._shown_frame = self._requested_frame
         self.categorize_tree.update_props(props)
         self.raw_table.update_props(props)
 
+    @run_in_background(name="FramePropsPrepare")
+    def _prepare_views(self, props: Mapping[str, Any]) -> None:
+        try:
+            tree_rows = FramePropsModel.prepare_rows(props)
+            table_rows = FramePropsTableModel.prepare_rows(props)
+        except Exception:
+            logger.exception("Error preparing the frame props in the background, retrying on the GUI thread")
+            self._on_views_prepare_failed(props)
+        else:
+            self._on_views_prepared(props, tree_rows, table_rows)
+
+    @run_in_loop(return_future=False)
+    def _on_views_prepared(
+        self,
+        props: Mapping[str, Any],
+        tree_rows: list[tuple[str, list[PreparedRow]]],
+        table_rows: list[PreparedRow],
+    ) -> None:
+        # A newer frame was requested while these rows were being prepared
+        if props is not self._requested_props:
+            return
+
+        self.categorize_tree.current_model.add_prepared(props, tree_rows)
+        self.raw_table.current_model.add_prepared(props, table_rows)
+        self._apply_views(props)
+
+    @run_in_loop(return_future=False)
+    def _on_views_prepare_failed(self, props: Mapping[str, Any]) -> None:
+        if props is not self._requested_props:
+            return
+
+        # The models prepare the rows synchronously when nothing was prepared for these props
+        self._apply_views(props)
+
     def update_nav_buttons(self) -> None:
         if not self.history_combo.isEnabled():
             self.prev_btn.setEnabled(False)
@@ -641,14 +1117,15 @@ class FramePropsPlugin(WidgetPluginBase[GlobalSettings, LocalSettings], IconRelo
         self.prev_btn.setEnabled(current_index > 0)
         self.next_btn.setEnabled(current_index < self.history_combo.count() - 1)
 
-    def refresh_preview(self, current_frame: int) -> None:
-        if self.splitter.sizes()[1] == 0:
+    def refresh_preview(self, props: Mapping[str, Any], frame: int) -> None:
+        if not self._preview_visible:
             return
 
-        props = self.api.current_voutput.props[current_frame]
+        if (key := self.current_preview_key) in props and isinstance(value := props[key], vs.VideoFrame):
+            self.preview_view.set_frame(value, self._preview_cache_key(frame, key))
 
-        if (key := self.current_preview_key) in props and isinstance(props[key], vs.VideoFrame):
-            self.preview_view.set_frame(props[key])
+    def _preview_cache_key(self, frame: int | None, key_name: str) -> Hashable | None:
+        return None if frame is None else (self.api.current_voutput.vs_index, frame, key_name)
 
     def status_message(self, message: str) -> None:
         if len(msg_lines := message.split("\n")) > 1:
@@ -678,10 +1155,17 @@ class FramePropsPlugin(WidgetPluginBase[GlobalSettings, LocalSettings], IconRelo
             return
 
         if (frame := self.history_combo.itemData(index)) is not None and frame in self.api.current_voutput.props:
+            # The views now show a history entry, the next current frame notification must not be skipped
+            self._flushed_frame = None
+
             props = self.api.current_voutput.props[frame]
-            self.update_views(props)
+            self.update_views(props, frame)
             self.update_nav_buttons()
-            self.refresh_preview(frame)
+            self.refresh_preview(props, frame)
+
+    def _on_splitter_moved(self, pos: int, index: int) -> None:
+        # The preview pane can also be collapsed or reopened by dragging the handle
+        self._preview_visible = self.splitter.sizes()[1] > 0 and hasattr(self, "current_preview_key")
 
     def _on_prev_clicked(self) -> None:
         current_index = self.history_combo.currentIndex()
@@ -697,13 +1181,16 @@ class FramePropsPlugin(WidgetPluginBase[GlobalSettings, LocalSettings], IconRelo
         self.current_preview_key = key_name
 
         self.preview_label.setText(f"Preview: {key_name!r}")
-        self.preview_view.set_frame(frame)
+        # The requested row comes from the props the views show
+        self.preview_view.set_frame(frame, self._preview_cache_key(self._shown_frame, key_name))
 
         self.splitter.setSizes([int(self.splitter.height() * 0.6), int(self.splitter.height() * 0.4)])
+        self._preview_visible = True
 
     @run_in_loop(return_future=False)
     def _hide_preview(self) -> None:
         self.splitter.setSizes([1, 0])
+        self._preview_visible = False
         self.preview_view.reset_scene()
 
         with suppress(AttributeError):
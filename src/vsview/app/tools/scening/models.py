@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import timedelta
-from typing import Annotated
+from functools import cached_property, lru_cache
+from typing import Annotated, Any
 from uuid import UUID, uuid4
 
 from jetpytools import fallback
@@ -12,14 +13,34 @@ from PySide6.QtGui import QColor
 from vsview.api import Time, VideoOutputProxy
 
 
+@lru_cache(maxsize=512)
+def _parse_color(name: str) -> QColor:
+    return QColor(name)
+
+
+def _to_qcolor(v: Any) -> QColor:
+    if isinstance(v, QColor):
+        return v
+
+    if isinstance(v, str):
+        # Sessions repeat a handful of color names, parse each once.
+        # The cached QColor is shared, so every row gets its own copy.
+        return QColor(_parse_color(v))
+
+    return QColor(v)
+
+
 class UUIDModel(BaseModel):
     id: UUID = Field(default_factory=uuid4, repr=False, init=False)
 
     def __hash__(self) -> int:
-        return hash(self.id)
+        return hash(self.id.int)
 
     def __eq__(self, other: object) -> bool:
-        return self.id == other.id if isinstance(other, UUIDModel) else NotImplemented
+        if not isinstance(other, UUIDModel):
+            return NotImplemented
+
+        return self.id.int == other.id.int
 
 
 class AbstractRange[T](ABC, UUIDModel):
@@ -92,15 +113,16 @@ class RangeTime(AbstractRange[timedelta], UUIDModel):
 class SceneRow(UUIDModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    color: Annotated[QColor, BeforeValidator(lambda v: v if isinstance(v, QColor) else QColor(v))]
+    color: Annotated[QColor, BeforeValidator(_to_qcolor)]
     name: str
     checked_outputs: set[int] = Field(default_factory=set)
     display: bool = True
 
     ranges: list[RangeFrame | RangeTime] | list[RangeFrame] | list[RangeTime] = Field(default_factory=list)
 
-    @property
+    @cached_property
     def notch_id(self) -> str:
+        # The id never changes, so the import and formatting are only paid once per scene
         from .plugin import PLUGIN_IDENTIFIER
 
         return ".".join([PLUGIN_IDENTIFIER, str(self.id)])
@@ -6,13 +6,15 @@ from enum import StrEnum
 from functools import cache
 from itertools import count
 from logging import getLogger
+from operator import itemgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Self
 
 import pluggy
+import vapoursynth as vs
 from jetpytools import cachedproperty, flatten, to_arr
 from pydantic import BaseModel, Field
-from PySide6.QtCore import QPoint, Qt
+from PySide6.QtCore import QPoint, Qt, QTimer
 from PySide6.QtGui import QAction, QKeySequence
 from PySide6.QtWidgets import (
     QAbstractItemView,
@@ -47,6 +49,8 @@ from .ui import Col, RangeCol, RangeTableDelegate, RangeTableModel, SceneTableDe
 from .utils import ColorGenerator, monkey_patch_parser
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from .api import Parser
 
 logger = getLogger(__name__)
@@ -66,6 +70,18 @@ def load_external_parsers() -> None:
     logger.debug("Loaded %d external parsers", n)
 
 
+@cache
+def get_import_filters() -> tuple[dict[str, Parser], str]:
+    """Return the file dialog filters mapped to their parser and the joined filter string, built once."""
+    load_external_parsers()
+
+    parsers: list[Parser] = internal_parsers + list(flatten(manager.hook.vsview_scening_register_parser()))
+
+    filters = {f"{p.filter.label} (*.{' *.'.join(to_arr(p.filter.suffix))})": p for p in parsers}
+
+    return filters, ";;".join(sorted(filters))
+
+
 class ShortcutDefinition(StrEnum):
     definition: ActionDefinition
 
@@ -106,12 +122,27 @@ class SceningPlugin(WidgetPluginBase[None, LocalSettings], IconReloadMixin):
         self._pending_start: Frame | Time | None = None
         self._pending_end: Frame | Time | None = None
 
+        # Sorted frame boundaries of the listed ranges for the seek shortcuts, rebuilt lazily once invalidated
+        self._bounds_cache = list[int]()
+        self._starts_cache = list[int]()
+        self._bounds_dirty = True
+        # Output the ranges and timeline notches were last refreshed for, as (index, output tuple)
+        self._refreshed_output: tuple[int, vs.VideoOutputTuple] | None = None
+
+        # Every persist revalidates all stored scenes, so bursts of modifications are written once
+        self._persist_timer = QTimer(self)
+        self._persist_timer.setSingleShot(True)
+        self._persist_timer.setInterval(0)
+        self._persist_timer.timeout.connect(self._persist_scenes)
+
         self.setup_ui()
         self.setup_shortcuts()
         self.load_settings()
 
         self.register_icon_callback(self.on_reload_icon)
-        self.api.register_on_destroy(self.init_load.cache_clear)
+        self.api.register_on_destroy(get_import_filters.cache_clear)
+        self.api.register_on_destroy(self._flush_persist)
+        self.api.register_on_destroy(self._forget_refreshed_output)
 
     def setup_ui(self) -> None:
         layout = QVBoxLayout(self)
@@ -147,7 +178,7 @@ class SceningPlugin(WidgetPluginBase[None, LocalSettings], IconReloadMixin):
 
         # Scenes model + delegate
         self.scenes_model = SceneTableModel(self.output_map, self.scenes_container)
-        self.scenes_model.scenesModified.connect(self._persist_scenes)
+        self.scenes_model.scenesModified.connect(self._persist_timer.start)
         self.scenes_model.sceneDisplayModified.connect(self._refresh_scene_on_timeline)
         self.scenes_model.sceneColorModified.connect(self._refresh_scene_on_timeline)
         self.scenes_model.sceneCheckOutputsModified.connect(self._refresh_scene_on_timeline)
@@ -224,8 +255,10 @@ class SceningPlugin(WidgetPluginBase[None, LocalSettings], IconReloadMixin):
         range_toolbar.addActions([self.range_start_action, self.range_end_action, self.add_range_action])
 
         self.ranges_model = RangeTableModel(self.range_container, self.api)
-        self.ranges_model.rangesModified.connect(self._persist_scenes)
+        self.ranges_model.rangesModified.connect(self._persist_timer.start)
+        self.ranges_model.rangesModified.connect(self._invalidate_bounds_cache)
         self.ranges_model.rangeDataModified.connect(self._refresh_range_on_timeline)
+        self.ranges_model.rangeDataModified.connect(self._invalidate_bounds_cache)
         self.ranges_model.modelReset.connect(self._update_ranges_header_width)
         self.ranges_model.rowsInserted.connect(self._update_ranges_header_width)
         self.ranges_model.rowsRemoved.connect(self._update_ranges_header_width)
@@ -254,6 +287,20 @@ class SceningPlugin(WidgetPluginBase[None, LocalSettings], IconReloadMixin):
         self.copy_frames_action.triggered.connect(self._copy_ranges_frames)
         self.ranges_view.addAction(self.copy_frames_action)
 
+        # Built once, the actions read the selection when triggered
+        self.ranges_context_menu = QMenu(self.ranges_view)
+        self.ranges_context_menu.addAction(self.copy_frames_action)
+        self.ranges_context_menu.addAction("Copy start frames only", self._copy_ranges_start_frames)
+        self.ranges_context_menu.addAction("Copy end frames only", self._copy_ranges_end_frames)
+        self.ranges_context_menu.addSeparator()
+
+        self.ranges_context_menu.addAction("Copy timestamps", self._copy_ranges_timestamps)
+        self.ranges_context_menu.addAction("Copy start timestamps only", self._copy_ranges_start_timestamps)
+        self.ranges_context_menu.addAction("Copy end timestamps only", self._copy_ranges_end_timestamps)
+        self.ranges_context_menu.addSeparator()
+
+        self.ranges_context_menu.addAction("Copy labels", self._copy_ranges_labels)
+
         r_header = self.ranges_view.horizontalHeader()
         r_header.setSectionResizeMode(RangeCol.START_FRAME, QHeaderView.ResizeMode.Interactive)
         r_header.setSectionResizeMode(RangeCol.END_FRAME, QHeaderView.ResizeMode.Interactive)
@@ -327,28 +374,45 @@ class SceningPlugin(WidgetPluginBase[None, LocalSettings], IconReloadMixin):
 
         # Set the next color based on the last scene
         if scenes := self.settings.local_.scenes:
-            next(self._color_gen)
-            self._color_gen.send(scenes[-1].color)
+            self._color_gen.seed(scenes[-1].color)
 
         self._counter = count(len(scenes) + 1)
 
         # Load scenes from settings
-        for scene in self.settings.local_.scenes:
-            self.scenes_model.add_scene(scene, emit_signal=False)
+        self.scenes_model.add_scenes(self.settings.local_.scenes, emit_signal=False)
 
-    @cache
     def init_load(self) -> None:
-        self.output_map.clear()
-        self.output_map.update((out.vs_index, out.vs_name) for out in self.api.voutputs)
+        output_map = {out.vs_index: out.vs_name for out in self.api.voutputs}
+
+        if output_map != self.output_map:
+            self.output_map.clear()
+            self.output_map.update(output_map)
+            self.scenes_model.invalidate_outputs_text()
 
     def on_current_voutput_changed(self, voutput: VideoOutputProxy, tab_index: int) -> None:
         self.init_load()
-        cachedproperty.clear_cache(self.ranges_model)
+
+        # The plugin is notified again whenever it becomes visible, even if the output didn't change.
+        # A reload replaces the output tuple, so it is compared by identity.
+        if (
+            (refreshed := self._refreshed_output)
+            and refreshed[0] == voutput.vs_index
+            and refreshed[1] is voutput.vs_output
+        ):
+            return super().on_current_voutput_changed(voutput, tab_index)
+
+        self._refreshed_output = (voutput.vs_index, voutput.vs_output)
+        self.ranges_model.invalidate_voutput_cache()
+        # Time based ranges map to other frames with another framerate
+        self._invalidate_bounds_cache()
 
         self.on_scene_selection_changed()
 
         return super().on_current_voutput_changed(voutput, tab_index)
 
+    def _forget_refreshed_output(self) -> None:
+        self._refreshed_output = None
+
     def on_reload_icon(self) -> None:
         cachedproperty.clear_cache(self.scenes_delegate)
         self.scenes_view.viewport().update()
@@ -361,16 +425,9 @@ class SceningPlugin(WidgetPluginBase[None, LocalSettings], IconReloadMixin):
         self.scenes_view.setCurrentIndex(idx)
 
     def on_import_scene(self) -> None:
-        load_external_parsers()
+        filters, filter_str = get_import_filters()
 
-        parsers: list[Parser] = internal_parsers + list(flatten(manager.hook.vsview_scening_register_parser()))
-
-        filters = {f"{p.filter.label} (*.{' *.'.join(to_arr(p.filter.suffix))})": p for p in parsers}
-        files, selected_filter = QFileDialog.getOpenFileNames(
-            self,
-            "Import scene file(s)",
-            filter=";;".join(sorted(filters)),
-        )
+        files, selected_filter = QFileDialog.getOpenFileNames(self, "Import scene file(s)", filter=filter_str)
 
         if not files:
             logger.info("No file selected")
@@ -384,8 +441,7 @@ class SceningPlugin(WidgetPluginBase[None, LocalSettings], IconReloadMixin):
                 logger.exception("Error parsing file(s)")
                 return
 
-            for scene in f.result():
-                self.scenes_model.add_scene(scene, emit_signal=False)
+            self.scenes_model.add_scenes(f.result(), emit_signal=False)
 
             self._persist_scenes()
 
@@ -411,11 +467,11 @@ class SceningPlugin(WidgetPluginBase[None, LocalSettings], IconReloadMixin):
         if not (selected_indexes := self.scenes_view.selectionModel().selectedRows()):
             return
 
-        rows = sorted((idx.row() for idx in selected_indexes), reverse=True)
-
-        self.scenes_model.remove_scene(rows)
+        self.scenes_model.remove_scene([idx.row() for idx in selected_indexes])
 
     def on_scene_selection_changed(self) -> None:
+        self._invalidate_bounds_cache()
+
         if selected_indexes := self.scenes_view.selectionModel().selectedRows():
             self.range_container.setEnabled(True)
             all_scenes = list[SceneRow]()
@@ -425,13 +481,14 @@ class SceningPlugin(WidgetPluginBase[None, LocalSettings], IconReloadMixin):
 
             self.ranges_model.set_scenes(all_scenes)
 
-            # Add displayable scenes to the timeline
-            for scene in all_scenes:
-                self._refresh_scene_on_timeline(scene, update=False)
+            # Add displayable scenes to the timeline, all of their notches in one batch
+            self.api.timeline.clear_notches((scene.notch_id for scene in all_scenes), update=False)
+            self._add_scene_notches(all_scenes)
 
-            # Remove old references
+            # Remove old references, only the selection is hashed and by its cached notch ids
+            selected_ids = {scene.notch_id for scene in all_scenes}
             self.api.timeline.clear_notches(
-                (scene.notch_id for scene in set(self.settings.local_.scenes).difference(all_scenes)),
+                (notch_id for scene in self.settings.local_.scenes if (notch_id := scene.notch_id) not in selected_ids),
                 update=True,
             )
         else:
@@ -502,9 +559,11 @@ class SceningPlugin(WidgetPluginBase[None, LocalSettings], IconReloadMixin):
             return
 
         # Sort by row descending to avoid index shifts
-        for idx in sorted(selected_indexes, key=lambda idx: idx.row(), reverse=True):
-            r = self.ranges_model.data(idx, self.ranges_model.RangeRole)
-            scene = self.ranges_model.data(idx, self.ranges_model.SceneRowRole)
+        rows = [(idx.row(), idx) for idx in selected_indexes]
+        rows.sort(key=itemgetter(0), reverse=True)
+
+        for row, idx in rows:
+            r, scene = self.ranges_model.ranges[row]
 
             self.ranges_model.remove_range(idx)
             self.api.timeline.discard_notch(scene.notch_id, [r.to_tuple()], r.id, update=False)
@@ -523,19 +582,32 @@ class SceningPlugin(WidgetPluginBase[None, LocalSettings], IconReloadMixin):
     def on_seek_next_range(self) -> None:
         self._seek_to_neighbor(self._get_visible_range_boundaries(starts_only=True), forward=True)
 
+    def _flush_persist(self) -> None:
+        if self._persist_timer.isActive():
+            self._persist_timer.stop()
+            self._persist_scenes()
+
     def _persist_scenes(self) -> None:
+        self._persist_timer.stop()
         scenes = self.scenes_model.scenes.copy()
         self.settings.local_.scenes = scenes
 
         if scenes:
-            self._color_gen.send(scenes[-1].color)
+            self._color_gen.seed(scenes[-1].color)
+
+    def _add_scene_notches(self, scenes: Iterable[SceneRow]) -> None:
+        vs_index = self.api.current_voutput.vs_index
+
+        for scene in scenes:
+            if scene.display and (not scene.checked_outputs or vs_index in scene.checked_outputs):
+                for r in scene.ranges:
+                    self.api.timeline.add_notch(
+                        scene.notch_id, [r.to_tuple()], scene.color, r.label, r.id, update=False
+                    )
 
     def _refresh_scene_on_timeline(self, scene: SceneRow, *, update: bool = True) -> None:
         self.api.timeline.clear_notches(scene.notch_id, update=False)
-
-        if scene.display and (not scene.checked_outputs or self.api.current_voutput.vs_index in scene.checked_outputs):
-            for r in scene.ranges:
-                self.api.timeline.add_notch(scene.notch_id, [r.to_tuple()], scene.color, r.label, r.id, update=False)
+        self._add_scene_notches([scene])
 
         if update:
             self.api.timeline.update()
@@ -550,43 +622,37 @@ class SceningPlugin(WidgetPluginBase[None, LocalSettings], IconReloadMixin):
     def _selected_ranges(self) -> list[RangeFrame | RangeTime]:
         return [idx.data(self.ranges_model.RangeRole) for idx in self.ranges_view.selectionModel().selectedRows()]
 
+    def _selected_range_projections(self) -> list[tuple[tuple[int, int], tuple[Time, Time]]]:
+        # Frame and time bounds of the selected ranges, memoized by the model for the current output
+        return [self.ranges_model.converted(r) for r in self._selected_ranges()]
+
     def _copy_ranges_frames(self) -> None:
-        v = self.api.current_voutput
-        text = ", ".join(str(r.as_frames(v)) for r in self._selected_ranges())
+        text = ", ".join(str(frames) for frames, _ in self._selected_range_projections())
 
         QApplication.clipboard().setText(f"[{text}]")
 
     def _copy_ranges_start_frames(self) -> None:
-        v = self.api.current_voutput
-        text = ", ".join(str(r.as_frames(v)[0]) for r in self._selected_ranges())
+        text = ", ".join(str(frames[0]) for frames, _ in self._selected_range_projections())
 
         QApplication.clipboard().setText(f"[{text}]")
 
     def _copy_ranges_end_frames(self) -> None:
-        v = self.api.current_voutput
-        text = ", ".join(str(r.as_frames(v)[1]) for r in self._selected_ranges())
+        text = ", ".join(str(frames[1]) for frames, _ in self._selected_range_projections())
 
         QApplication.clipboard().setText(f"[{text}]")
 
     def _copy_ranges_timestamps(self) -> None:
-        v = self.api.current_voutput
-        parts = list[str]()
-
-        for r in self._selected_ranges():
-            s, e = r.as_times(v)
-            parts.append(f'("{s.to_ts()}", "{e.to_ts()}")')
+        text = ", ".join(f'("{s.to_ts()}", "{e.to_ts()}")' for _, (s, e) in self._selected_range_projections())
 
-        QApplication.clipboard().setText(f"[{', '.join(parts)}]")
+        QApplication.clipboard().setText(f"[{text}]")
 
     def _copy_ranges_start_timestamps(self) -> None:
-        v = self.api.current_voutput
-        text = ", ".join(f'"{r.as_times(v)[0].to_ts()}"' for r in self._selected_ranges())
+        text = ", ".join(f'"{times[0].to_ts()}"' for _, times in self._selected_range_projections())
 
         QApplication.clipboard().setText(f"[{text}]")
 
     def _copy_ranges_end_timestamps(self) -> None:
-        v = self.api.current_voutput
-        text = ", ".join(f'"{r.as_times(v)[1].to_ts()}"' for r in self._selected_ranges())
+        text = ", ".join(f'"{times[1].to_ts()}"' for _, times in self._selected_range_projections())
 
         QApplication.clipboard().setText(f"[{text}]")
 
@@ -599,34 +665,31 @@ class SceningPlugin(WidgetPluginBase[None, LocalSettings], IconReloadMixin):
         if not self.ranges_view.selectionModel().selectedRows():
             return
 
-        menu = QMenu(self.ranges_view)
-        menu.addAction(self.copy_frames_action)
-        menu.addAction("Copy start frames only", self._copy_ranges_start_frames)
-        menu.addAction("Copy end frames only", self._copy_ranges_end_frames)
-        menu.addSeparator()
-
-        menu.addAction("Copy timestamps", self._copy_ranges_timestamps)
-        menu.addAction("Copy start timestamps only", self._copy_ranges_start_timestamps)
-        menu.addAction("Copy end timestamps only", self._copy_ranges_end_timestamps)
-        menu.addSeparator()
+        self.ranges_context_menu.exec(self.ranges_view.viewport().mapToGlobal(pos))
 
-        menu.addAction("Copy labels", self._copy_ranges_labels)
-
-        menu.exec(self.ranges_view.viewport().mapToGlobal(pos))
-        menu.deleteLater()
+    def _invalidate_bounds_cache(self) -> None:
+        self._bounds_dirty = True
 
     def _get_visible_range_boundaries(self, starts_only: bool = False) -> list[int]:
-        v = self.api.current_voutput
-        points = set[int]()
+        if self._bounds_dirty:
+            bounds = list[int]()
+            starts = list[int]()
+
+            for r, _ in self.ranges_model.ranges:
+                (start, end), _ = self.ranges_model.converted(r)
+                bounds.append(start)
+                bounds.append(end)
+                starts.append(start)
 
-        for r, _ in self.ranges_model.ranges:
-            start, end = r.as_frames(v)
-            points.add(start)
+            # Duplicates are kept, the bisections in _seek_to_neighbor step over them
+            bounds.sort()
+            starts.sort()
 
-            if not starts_only:
-                points.add(end)
+            self._bounds_cache = bounds
+            self._starts_cache = starts
+            self._bounds_dirty = False
 
-        return sorted(points)
+        return self._starts_cache if starts_only else self._bounds_cache
 
     def _seek_to_neighbor(self, points: list[int], forward: bool) -> None:
         if not points:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Iterator, Sequence
+from collections.abc import Callable, Iterator, Sequence
 from contextlib import contextmanager
 from copy import copy
 from datetime import timedelta
@@ -93,10 +93,22 @@ class SceneTableModel(AbstractTableModel):
     sceneColorModified = Signal(SceneRow)
     sceneCheckOutputsModified = Signal(SceneRow)
 
+    _DATA_ROLES = frozenset(
+        {
+            Qt.ItemDataRole.DisplayRole,
+            Qt.ItemDataRole.EditRole,
+            Qt.ItemDataRole.DecorationRole,
+            Qt.ItemDataRole.TextAlignmentRole,
+            ROLE_CHECK_STATE,
+            SceneRowRole,
+        }
+    )
+
     def __init__(self, output_map: dict[int, str], parent: QWidget) -> None:
         super().__init__(parent)
         self.scenes = list[SceneRow]()
         self.output_map = output_map
+        self._outputs_text = dict[SceneRow, str]()
 
     def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
         return len(self.scenes)
@@ -105,24 +117,26 @@ class SceneTableModel(AbstractTableModel):
         return len(Col)
 
     def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
-        if not index.isValid() or not (0 <= index.row() < len(self.scenes)):
+        if role not in self._DATA_ROLES or not index.isValid() or not (0 <= index.row() < len(self.scenes)):
             return None
 
         scene = self.scenes[index.row()]
-        col = Col(index.column())
+        col = index.column()
 
         match role:
             case Qt.ItemDataRole.DisplayRole:
                 if col == Col.NAME:
                     return scene.name
                 if col == Col.OUTPUTS:
-                    return (
-                        "All Outputs"
-                        if not scene.checked_outputs
-                        else ", ".join(
-                            self.output_map.get(idx, f"Output {idx}") for idx in sorted(scene.checked_outputs)
+                    if (text := self._outputs_text.get(scene)) is None:
+                        text = self._outputs_text[scene] = (
+                            "All Outputs"
+                            if not scene.checked_outputs
+                            else ", ".join(
+                                self.output_map.get(idx, f"Output {idx}") for idx in sorted(scene.checked_outputs)
+                            )
                         )
-                    )
+                    return text
 
             case Qt.ItemDataRole.EditRole if col == Col.NAME:
                 return scene.name
@@ -156,28 +170,34 @@ class SceneTableModel(AbstractTableModel):
             return False
 
         scene = self.scenes[index.row()]
-        col = Col(index.column())
+        col = index.column()
 
         match role:
             case Qt.ItemDataRole.EditRole if col == Col.NAME:
                 scene.name = str(value)
+                roles = [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole]
 
             case _ if role == ROLE_CHECK_STATE and col == Col.DISPLAY:
                 scene.display = value == Qt.CheckState.Checked.value
                 self.sceneDisplayModified.emit(scene)
+                roles = [ROLE_CHECK_STATE]
 
             case Qt.ItemDataRole.DecorationRole if col == Col.COLOR and isinstance(value, QColor):
                 scene.color = value
                 self.sceneColorModified.emit(scene)
+                roles = [Qt.ItemDataRole.DecorationRole]
 
             case Qt.ItemDataRole.UserRole if col == Col.OUTPUTS and isinstance(value, set):
                 scene.checked_outputs = value
+                self._outputs_text.pop(scene, None)
                 self.sceneCheckOutputsModified.emit(scene)
+                roles = [Qt.ItemDataRole.DisplayRole]
 
             case _:
                 return False
 
-        self.dataChanged.emit(index, index)
+        # Only the roles that changed, views can skip requerying the others
+        self.dataChanged.emit(index, index, roles)
         self.scenesModified.emit()
         return True
 
@@ -187,7 +207,7 @@ class SceneTableModel(AbstractTableModel):
 
         base = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
 
-        return base | Qt.ItemFlag.ItemIsEditable if Col(index.column()) == Col.NAME else base
+        return base | Qt.ItemFlag.ItemIsEditable if index.column() == Col.NAME else base
 
     def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
         return (
@@ -210,15 +230,43 @@ class SceneTableModel(AbstractTableModel):
             self.scenesModified.emit()
         return self.index(row, 0)
 
+    def invalidate_outputs_text(self) -> None:
+        """Drop the formatted output names, call this when the output map changes."""
+        self._outputs_text.clear()
+
+        if self.scenes:
+            self.dataChanged.emit(
+                self.index(0, Col.OUTPUTS), self.index(len(self.scenes) - 1, Col.OUTPUTS), [Qt.ItemDataRole.DisplayRole]
+            )
+
+    def add_scenes(self, scenes: Sequence[SceneRow], emit_signal: bool = True) -> None:
+        """Append all the scenes in a single row insertion."""
+        if not scenes:
+            return
+
+        row = len(self.scenes)
+
+        with self.insert_rows(row, row + len(scenes) - 1):
+            self.scenes.extend(scenes)
+
+        if emit_signal:
+            self.scenesModified.emit()
+
     def remove_scene(self, row: int | Sequence[int]) -> None:
-        if isinstance(row, Sequence):
-            start, end = min(row), max(row)
-        else:
-            start, end = row, row
+        rows = sorted(set(to_arr(row)))
+
+        # Remove each contiguous run of rows at once, bottom-up so the remaining rows keep their indices
+        while rows:
+            end = start = rows.pop()
 
-        with self.remove_rows(start, end):
-            for r in to_arr(row):
-                self.scenes.pop(r)
+            while rows and rows[-1] == start - 1:
+                start = rows.pop()
+
+            with self.remove_rows(start, end):
+                for scene in self.scenes[start : end + 1]:
+                    self._outputs_text.pop(scene, None)
+
+                del self.scenes[start : end + 1]
 
         self.scenesModified.emit()
 
@@ -233,6 +281,7 @@ class NonClosingMenu(QMenu):
 
 class SceneTableDelegate(QStyledItemDelegate):
     SWATCH_SIZE = 16
+    SWATCH_BORDER = QColor("#555")
     DELETE_ICON_SIZE = QSize(16, 16)
 
     colorChosen = Signal(QModelIndex)
@@ -241,6 +290,16 @@ class SceneTableDelegate(QStyledItemDelegate):
         super().__init__(parent)
         self.output_map = outputs_map
 
+        # Built once, the output actions are only recreated when the outputs changed since the last opening
+        self.outputs_menu = NonClosingMenu(parent)
+        self.all_outputs_action = self.outputs_menu.addAction("All Outputs")
+        self.all_outputs_action.setCheckable(True)
+        self.all_outputs_action.toggled.connect(self._on_all_action_toggle)
+        self.outputs_menu.addSeparator()
+
+        self._output_actions = list[QAction]()
+        self._output_actions_map = dict[int, str]()
+
     @cachedproperty
     def delete_pixmap(self) -> QPixmap:
         return load_icon(IconName.X_CIRCLE, self.DELETE_ICON_SIZE, QColor("#e74c3c"))
@@ -263,7 +322,7 @@ class SceneTableDelegate(QStyledItemDelegate):
         painter.restore()
 
         # Content drawing per column
-        match Col(index.column()):
+        match index.column():
             case Col.COLOR:
                 self._paint_color(painter, option, index)
             case Col.NAME | Col.OUTPUTS:
@@ -300,7 +359,7 @@ class SceneTableDelegate(QStyledItemDelegate):
             painter.save()
             painter.setRenderHint(QPainter.RenderHint.Antialiasing)
             painter.setBrush(color)
-            painter.setPen(QColor("#555"))
+            painter.setPen(self.SWATCH_BORDER)
             painter.drawRoundedRect(self._center_rect(option.rect, self.SWATCH_SIZE), 3, 3)
             painter.restore()
 
@@ -333,7 +392,7 @@ class SceneTableDelegate(QStyledItemDelegate):
         option: QStyleOptionViewItem,
         index: QModelIndex | QPersistentModelIndex,
     ) -> bool:
-        match Col(index.column()), event.type():
+        match index.column(), event.type():
             case Col.DISPLAY, QEvent.Type.MouseButtonPress | QEvent.Type.MouseButtonDblClick:
                 new_state = (
                     Qt.CheckState.Unchecked.value
@@ -372,10 +431,10 @@ class SceneTableDelegate(QStyledItemDelegate):
         option: QStyleOptionViewItem,
         index: QModelIndex | QPersistentModelIndex,
     ) -> QWidget:
-        return QLineEdit(parent) if Col(index.column()) == Col.NAME else super().createEditor(parent, option, index)
+        return QLineEdit(parent) if index.column() == Col.NAME else super().createEditor(parent, option, index)
 
     def setEditorData(self, editor: QWidget, index: QModelIndex | QPersistentModelIndex) -> None:
-        if Col(index.column()) == Col.NAME and isinstance(editor, QLineEdit):
+        if index.column() == Col.NAME and isinstance(editor, QLineEdit):
             value = index.data(Qt.ItemDataRole.EditRole)
             editor.setText(str(value) if value else "")
             editor.selectAll()
@@ -389,7 +448,7 @@ class SceneTableDelegate(QStyledItemDelegate):
         model: QAbstractItemModel,
         index: QModelIndex | QPersistentModelIndex,
     ) -> None:
-        if Col(index.column()) == Col.NAME and isinstance(editor, QLineEdit):
+        if index.column() == Col.NAME and isinstance(editor, QLineEdit):
             model.setData(index, editor.text(), Qt.ItemDataRole.EditRole)
             return
 
@@ -409,44 +468,51 @@ class SceneTableDelegate(QStyledItemDelegate):
         if not widget or not isinstance(scene := index.data(SceneTableModel.SceneRowRole), SceneRow):
             return
 
-        menu = NonClosingMenu(widget)
-        all_action = menu.addAction("All Outputs")
-        all_action.setCheckable(True)
-        menu.addSeparator()
-
-        # Track explicitly created output actions to avoid messy loop filtering later
-        output_actions = list[QAction]()
-        for vsindex, vs_name in self.output_map.items():
-            action = menu.addAction(vs_name)
-            action.setCheckable(True)
-            action.setData(vsindex)
-            action.setChecked(vsindex in scene.checked_outputs)
-            output_actions.append(action)
+        if self._output_actions_map != self.output_map:
+            self._rebuild_output_actions()
 
-        all_action.setChecked(not scene.checked_outputs)
+        # Outputs first, checking one of them unchecks "All Outputs" which is set last
+        for action in self._output_actions:
+            action.setChecked(action.data() in scene.checked_outputs)
 
-        # Connect signals
-        all_action.toggled.connect(lambda checked: self._on_all_action_toggle(checked, output_actions))
-
-        for act in output_actions:
-            act.toggled.connect(lambda checked: all_action.setChecked(False) if checked else None)
+        self.all_outputs_action.setChecked(not scene.checked_outputs)
 
         # Block and show menu
-        menu.exec(QCursor.pos())
+        self.outputs_menu.exec(QCursor.pos())
 
         # Collect results
-        new_checked = set() if all_action.isChecked() else {a.data() for a in output_actions if a.isChecked()}
+        new_checked = (
+            set() if self.all_outputs_action.isChecked() else {a.data() for a in self._output_actions if a.isChecked()}
+        )
 
         if index.model():
             index.model().setData(index, new_checked, Qt.ItemDataRole.UserRole)
 
-        menu.deleteLater()
+    def _rebuild_output_actions(self) -> None:
+        for action in self._output_actions:
+            self.outputs_menu.removeAction(action)
+            action.deleteLater()
+
+        self._output_actions.clear()
 
-    def _on_all_action_toggle(self, checked: bool, output_actions: list[QAction]) -> None:
+        for vsindex, vs_name in self.output_map.items():
+            action = self.outputs_menu.addAction(vs_name)
+            action.setCheckable(True)
+            action.setData(vsindex)
+            action.toggled.connect(self._on_output_action_toggle)
+            self._output_actions.append(action)
+
+        self._output_actions_map = self.output_map.copy()
+
+    def _on_all_action_toggle(self, checked: bool) -> None:
         if checked:
-            for action in output_actions:
+            for action in self._output_actions:
                 action.setChecked(False)
 
+    def _on_output_action_toggle(self, checked: bool) -> None:
+        if checked:
+            self.all_outputs_action.setChecked(False)
+
 
 class RangeCol(HeaderIntEnum):
     START_FRAME = 0, "Start Frame"
@@ -462,14 +528,29 @@ class RangeTableModel(AbstractTableModel):
     rangesModified = Signal()
     rangeDataModified = Signal(AbstractRange, SceneRow)
 
+    _DATA_ROLES = frozenset(
+        {
+            Qt.ItemDataRole.DisplayRole,
+            Qt.ItemDataRole.EditRole,
+            Qt.ItemDataRole.BackgroundRole,
+            Qt.ItemDataRole.TextAlignmentRole,
+            RangeRole,
+            SceneRowRole,
+        }
+    )
+
     def __init__(self, parent: QWidget, api: PluginAPI) -> None:
         super().__init__(parent)
         self._data = list[tuple[RangeFrame | RangeTime, SceneRow]]()
         self.api = api
         self._sort_column = -1
         self._sort_order = Qt.SortOrder.AscendingOrder
+        # Frame and time bounds of each range on the current output, the only state depending on it
+        self._conversions = dict[RangeFrame | RangeTime, tuple[tuple[int, int], tuple[Time, Time]]]()
+        # Translucent row backgrounds keyed by the scene color rgba, a recolored scene simply misses
+        self._backgrounds = dict[int, QColor]()
 
-        self.api.register_on_destroy(lambda: cachedproperty.clear_cache(self))
+        self.api.register_on_destroy(self.invalidate_voutput_cache)
 
     def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
         return len(self._data)
@@ -478,12 +559,11 @@ class RangeTableModel(AbstractTableModel):
         return len(RangeCol)
 
     def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
-        if not index.isValid() or not (0 <= index.row() < len(self._data)):
+        if role not in self._DATA_ROLES or not index.isValid() or not (0 <= index.row() < len(self._data)):
             return None
 
         range_item, scene = self._data[index.row()]
-        col = RangeCol(index.column())
-        v = self.current_voutput
+        col = index.column()
 
         match role:
             case Qt.ItemDataRole.DisplayRole:
@@ -491,30 +571,31 @@ class RangeTableModel(AbstractTableModel):
                     case RangeCol.LABEL:
                         return range_item.label
                     case RangeCol.START_FRAME:
-                        return str(range_item.as_frames(v)[0])
+                        return str(self.converted(range_item)[0][0])
                     case RangeCol.END_FRAME:
-                        return str(range_item.as_frames(v)[1])
+                        return str(self.converted(range_item)[0][1])
                     case RangeCol.START_TIME:
-                        return range_item.as_times(v)[0].to_ts("{H:02d}:{M:02d}:{S:02d}.{ms:03d}")
+                        return self.converted(range_item)[1][0].to_ts("{H:02d}:{M:02d}:{S:02d}.{ms:03d}")
                     case RangeCol.END_TIME:
-                        return range_item.as_times(v)[1].to_ts("{H:02d}:{M:02d}:{S:02d}.{ms:03d}")
+                        return self.converted(range_item)[1][1].to_ts("{H:02d}:{M:02d}:{S:02d}.{ms:03d}")
 
             case Qt.ItemDataRole.EditRole:
                 match col:
                     case RangeCol.LABEL:
                         return range_item.label
                     case RangeCol.START_FRAME:
-                        return range_item.as_frames(v)[0]
+                        return self.converted(range_item)[0][0]
                     case RangeCol.END_FRAME:
-                        return range_item.as_frames(v)[1]
+                        return self.converted(range_item)[0][1]
                     case RangeCol.START_TIME:
-                        return range_item.as_times(v)[0]
+                        return self.converted(range_item)[1][0]
                     case RangeCol.END_TIME:
-                        return range_item.as_times(v)[1]
+                        return self.converted(range_item)[1][1]
 
             case Qt.ItemDataRole.BackgroundRole:
-                color = copy(scene.color)
-                color.setAlphaF(color.alphaF() * 0.25)
+                if (color := self._backgrounds.get(rgba := scene.color.rgba())) is None:
+                    color = self._backgrounds[rgba] = copy(scene.color)
+                    color.setAlphaF(color.alphaF() * 0.25)
                 return color
 
             case Qt.ItemDataRole.TextAlignmentRole:
@@ -542,7 +623,7 @@ class RangeTableModel(AbstractTableModel):
             return False
 
         range_item, scene_row = self._data[index.row()]
-        col = RangeCol(index.column())
+        col = index.column()
         v = self.current_voutput
 
         if role == Qt.ItemDataRole.EditRole:
@@ -558,14 +639,20 @@ class RangeTableModel(AbstractTableModel):
                 case RangeCol.END_TIME:
                     range_item.from_times(None, Time.from_qtime(value), v)
 
+            self._conversions.pop(range_item, None)
+
+            roles = [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole]
+
             if col in (RangeCol.START_FRAME, RangeCol.START_TIME):
                 self.dataChanged.emit(
-                    self.index(index.row(), RangeCol.START_FRAME), self.index(index.row(), RangeCol.START_TIME)
+                    self.index(index.row(), RangeCol.START_FRAME), self.index(index.row(), RangeCol.START_TIME), roles
                 )
             elif col in (RangeCol.END_FRAME, RangeCol.END_TIME):
                 self.dataChanged.emit(
-                    self.index(index.row(), RangeCol.END_FRAME), self.index(index.row(), RangeCol.END_TIME)
+                    self.index(index.row(), RangeCol.END_FRAME), self.index(index.row(), RangeCol.END_TIME), roles
                 )
+            else:
+                self.dataChanged.emit(index, index, roles)
             self.rangeDataModified.emit(range_item, scene_row)
             self.rangesModified.emit()
             return True
@@ -598,6 +685,18 @@ class RangeTableModel(AbstractTableModel):
     def current_voutput(self) -> VideoOutputProxy:
         return self.api.current_voutput
 
+    def converted(self, range_item: RangeFrame | RangeTime) -> tuple[tuple[int, int], tuple[Time, Time]]:
+        """Return the `as_frames` and `as_times` bounds of a range on the current output."""
+        if (conversion := self._conversions.get(range_item)) is None:
+            v = self.current_voutput
+            conversion = self._conversions[range_item] = (range_item.as_frames(v), range_item.as_times(v))
+
+        return conversion
+
+    def invalidate_voutput_cache(self) -> None:
+        """Drop the conversions depending on the current output, call this when it changes."""
+        self._conversions.clear()
+
     def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
         self._sort_column = column
         self._sort_order = order
@@ -606,13 +705,14 @@ class RangeTableModel(AbstractTableModel):
     def set_scenes(self, scenes: list[SceneRow]) -> None:
         with self.reset_model():
             self._data.clear()
+            self._conversions.clear()
 
             for scene in scenes:
                 for r in scene.ranges:
                     self._data.append((r, scene))
 
             if self._sort_column >= 0:
-                self._data.sort(key=self._sort_key, reverse=self._sort_order == Qt.SortOrder.DescendingOrder)
+                self._data.sort(key=self._sort_key(), reverse=self._sort_order == Qt.SortOrder.DescendingOrder)
 
     def add_range(self, range_item: RangeFrame | RangeTime, scene: SceneRow) -> None:
         row = len(self._data)
@@ -630,27 +730,28 @@ class RangeTableModel(AbstractTableModel):
         with self.remove_rows(i):
             range_item, scene = self._data.pop(i)
             scene.ranges = [r for r in scene.ranges if r is not range_item]
+            self._conversions.pop(range_item, None)
 
         self.rangesModified.emit()
 
-    def _sort_key(self, item: tuple[RangeFrame | RangeTime, SceneRow]) -> Any:
-        range_item, _ = item
-        v = self.current_voutput
+    def _sort_key(self) -> Callable[[tuple[RangeFrame | RangeTime, SceneRow]], Any]:
+        # Resolve the sort column once, list.sort then calls the returned key once per row
+        converted = self.converted
 
-        match RangeCol(self._sort_column):
+        match self._sort_column:
             case RangeCol.START_FRAME | RangeCol.START_TIME:
-                return range_item.as_frames(v)[0]
+                return lambda item: converted(item[0])[0][0]
             case RangeCol.END_FRAME | RangeCol.END_TIME:
-                return range_item.as_frames(v)[1]
-            case RangeCol.LABEL:
-                return range_item.label.lower()
+                return lambda item: converted(item[0])[0][1]
+            case _:
+                return lambda item: item[0].label.lower()
 
     def _apply_sort(self) -> None:
         if self._sort_column < 0 or not self._data:
             return
 
         self.layoutAboutToBeChanged.emit()
-        self._data.sort(key=self._sort_key, reverse=self._sort_order == Qt.SortOrder.DescendingOrder)
+        self._data.sort(key=self._sort_key(), reverse=self._sort_order == Qt.SortOrder.DescendingOrder)
         self.layoutChanged.emit()
 
 
@@ -661,7 +762,7 @@ class RangeTableDelegate(QStyledItemDelegate):
         option: QStyleOptionViewItem,
         index: QModelIndex | QPersistentModelIndex,
     ) -> QWidget:
-        col = RangeCol(index.column())
+        col = index.column()
 
         match col:
             case RangeCol.START_FRAME | RangeCol.END_FRAME:
@@ -681,7 +782,7 @@ class RangeTableDelegate(QStyledItemDelegate):
         return editor
 
     def setEditorData(self, editor: QWidget, index: QModelIndex | QPersistentModelIndex) -> None:
-        col = RangeCol(index.column())
+        col = index.column()
         value = index.data(Qt.ItemDataRole.EditRole)
 
         match col:
@@ -711,7 +812,7 @@ class RangeTableDelegate(QStyledItemDelegate):
         model: QAbstractItemModel,
         index: QModelIndex | QPersistentModelIndex,
     ) -> None:
-        match RangeCol(index.column()):
+        match index.column():
             case RangeCol.START_FRAME | RangeCol.END_FRAME:
                 if isinstance(editor, FrameEdit):
                     model.setData(index, editor.value(), Qt.ItemDataRole.EditRole)
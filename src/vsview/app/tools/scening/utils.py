@@ -4,7 +4,6 @@ import threading
 from collections.abc import Generator, Iterator
 from contextlib import contextmanager
 from random import random
-from types import MethodType
 from typing import TYPE_CHECKING, Any
 
 from PySide6.QtGui import QColor
@@ -28,13 +27,18 @@ class ColorGenerator(Generator[QColor, QColor | None]):
             self._hue = (self._hue + self._golden_ratio_conjugate) % 1.0
             return res
 
+    def seed(self, value: QColor) -> None:
+        """Continue the sequence after `value` without building the color in between."""
+        with self._lock:
+            self._hue = (value.hueF() + self._golden_ratio_conjugate) % 1.0
+
     def throw(self, exc: BaseException, /, *_: Any) -> QColor:  # type: ignore[override]
         raise exc
 
 
 @contextmanager
 def monkey_patch_parser(parser: Parser, color_gen: Generator[QColor, QColor | None]) -> Iterator[None]:
-    setattr(parser, "get_color", MethodType(lambda _: next(color_gen), parser))
+    setattr(parser, "get_color", color_gen.__next__)
 
     try:
         yield
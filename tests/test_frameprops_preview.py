@@ -0,0 +1,31 @@
+import vapoursynth as vs
+from pytest_mock import MockerFixture
+from pytestqt.qtbot import QtBot
+
+from vsview.app.tools.frameprops.plugin import FramePropPreviewGraphicsView, FramePropsTableModel
+
+
+def _props_with_frame() -> vs.FrameProps:
+    clip = vs.core.std.BlankClip(width=8, height=8, format=vs.GRAY8, length=1)
+
+    frame = clip.get_frame(0).copy()
+    frame.props["Preview"] = clip.get_frame(0)
+
+    return frame.props
+
+
+def test_preview_cached_row_twice(qtbot: QtBot, mocker: MockerFixture) -> None:
+    view = FramePropPreviewGraphicsView(None, mocker.MagicMock())
+    qtbot.addWidget(view)
+
+    # Prepared rows are cached per props, revisiting a frame hands back the very same frame wrapper
+    (row,) = (row for row in FramePropsTableModel.prepare_rows(_props_with_frame()) if row.key == "Preview")
+
+    view.set_frame(row.value, (0, 0, row.key))
+    view.set_frame(row.value, (0, 0, row.key))
+    assert not view.pixmap_item.pixmap().isNull()
+
+    # Uncached previews convert the frame again, it must still be open
+    view.set_frame(row.value)
+    view.set_frame(row.value)
+    assert row.value.get_read_ptr(0).value